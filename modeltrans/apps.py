@@ -1,7 +1,7 @@
 import django.apps
 from django.apps import AppConfig
 
-from .conf import check_fallback_chain
+from .conf import check_fallback_chain, load_language_config
 from .translator import translate_model
 
 
@@ -10,6 +10,7 @@ class RegistrationConfig(AppConfig):
     verbose_name = "Django modeltrans using a registry."
 
     def ready(self):
+        load_language_config()
         check_fallback_chain()
 
         for Model in django.apps.apps.get_models():
@@ -0,0 +1,245 @@
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import F, IntegerField
+from django.db.models.functions import Floor
+
+from .migration import get_copy_translations_updates
+
+# Table recording the progress of the backfill for each model, created when needed.
+CHECKPOINT_TABLE = "modeltrans_backfill_checkpoint"
+
+CREATE_CHECKPOINT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key varchar(255) PRIMARY KEY,
+    last_pk text,
+    rows bigint NOT NULL DEFAULT 0,
+    completed boolean NOT NULL DEFAULT false,
+    updated timestamp with time zone NOT NULL DEFAULT now()
+)
+""".format(table=CHECKPOINT_TABLE)
+
+SAVE_CHECKPOINT_SQL = """
+INSERT INTO {table} (key, last_pk, rows, completed, updated) VALUES (%s, %s, %s, %s, now())
+ON CONFLICT (key) DO UPDATE SET
+    last_pk = EXCLUDED.last_pk,
+    rows = EXCLUDED.rows,
+    completed = EXCLUDED.completed,
+    updated = EXCLUDED.updated
+""".format(table=CHECKPOINT_TABLE)
+
+
+def create_checkpoint_table(using=DEFAULT_DB_ALIAS):
+    with connections[using].cursor() as cursor:
+        cursor.execute(CREATE_CHECKPOINT_TABLE_SQL)
+
+
+def get_checkpoint(key, using=DEFAULT_DB_ALIAS):
+    """
+    Return a tuple `(last_pk, rows, completed)` for the checkpoint `key`, or `None` if the
+    backfill did not start yet. `last_pk` is returned as a string.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT last_pk, rows, completed FROM {} WHERE key = %s".format(CHECKPOINT_TABLE),
+            [key],
+        )
+        return cursor.fetchone()
+
+
+def save_checkpoint(key, last_pk, rows, completed=False, using=DEFAULT_DB_ALIAS):
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            SAVE_CHECKPOINT_SQL, [key, None if last_pk is None else str(last_pk), rows, completed]
+        )
+
+
+def delete_checkpoints(models, using=DEFAULT_DB_ALIAS):
+    """
+    Delete the checkpoints for `models`, including the checkpoints for ranges of rows.
+    """
+    labels = [Model._meta.label for Model in models]
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM {} WHERE split_part(key, '[', 1) = ANY(%s)".format(CHECKPOINT_TABLE),
+            [labels],
+        )
+
+
+def get_checkpoint_key(Model, pk_range=None):
+    if pk_range is None:
+        return Model._meta.label
+    return "{}[{}:{}]".format(Model._meta.label, *pk_range)
+
+
+def get_pk_ranges(Model, range_size, using=DEFAULT_DB_ALIAS):
+    """
+    Return a list of `(start, end)` tuples covering the primary keys of `Model`, aligned to
+    multiples of `range_size` so they do not change when rows are added. Ranges without any
+    rows are left out.
+
+    Returns `[None]` (all rows) for models without an integer primary key or without rows.
+    """
+    if not isinstance(Model._meta.pk, IntegerField):
+        return [None]
+
+    starts = (
+        Model._base_manager.using(using)
+        .annotate(range_start=Floor(F("pk") / float(range_size)))
+        .order_by("range_start")
+        .values_list("range_start", flat=True)
+        .distinct()
+    )
+    ranges = [(int(start) * range_size, (int(start) + 1) * range_size) for start in starts]
+    return ranges or [None]
+
+
+def backfill_model(
+    Model, fields, batch_size=1000, sleep=0, using=DEFAULT_DB_ALIAS, stdout=None, pk_range=None
+):
+    """
+    Copy the values of the fields managed by django-modeltranslation into `i18n` for all rows
+    of `Model`, like `migration.copy_translations()`, resuming from the last checkpoint.
+    If `pk_range` is given, only rows with `start <= pk < end` are copied, using a separate
+    checkpoint.
+
+    Rows are updated in batches of `batch_size` rows ordered by primary key, each batch is
+    committed together with a checkpoint. The checkpoint table must exist, see
+    `create_checkpoint_table()`.
+
+    Arguments:
+        Model: the model to backfill.
+        fields (iterable): the fields managed by django-modeltranslation to copy.
+        batch_size (int): number of rows to update per transaction.
+        sleep (float): number of seconds to wait between batches, to limit the load on the
+            database.
+        using (str): alias of the database to update.
+        stdout: if given, a stream to write the progress to.
+        pk_range (tuple): `(start, end)` of the primary keys to copy, see `get_pk_ranges()`.
+
+    Returns:
+        The number of rows copied, including the rows copied by previous runs.
+    """
+    key = get_checkpoint_key(Model, pk_range)
+    checkpoint = get_checkpoint(key, using=using)
+    if checkpoint is None:
+        last_pk, rows = None, 0
+    else:
+        last_pk, rows, completed = checkpoint
+        if completed:
+            if stdout is not None:
+                stdout.write("{}: already completed ({} rows)\n".format(key, rows))
+            return rows
+        if last_pk is not None:
+            last_pk = Model._meta.pk.to_python(last_pk)
+
+    updates = get_copy_translations_updates(Model, fields)
+    queryset = Model._base_manager.using(using).order_by("pk")
+    if pk_range is not None:
+        queryset = queryset.filter(pk__gte=pk_range[0], pk__lt=pk_range[1])
+
+    started = time.monotonic()
+    copied = 0
+    while True:
+        batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = batch.values_list("pk", flat=True)
+        try:
+            batch_last_pk = pks[batch_size - 1]
+        except IndexError:
+            batch_last_pk = pks.last()
+            if batch_last_pk is None:
+                break
+
+        with transaction.atomic(using=using):
+            count = batch.filter(pk__lte=batch_last_pk).update(**updates)
+            save_checkpoint(key, batch_last_pk, rows + count, using=using)
+        rows += count
+        copied += count
+        last_pk = batch_last_pk
+
+        if stdout is not None:
+            elapsed = time.monotonic() - started
+            stdout.write(
+                "{}: {} rows copied, {:.0f} rows/s\n".format(
+                    key, rows, copied / elapsed if elapsed else copied
+                )
+            )
+
+        if sleep:
+            time.sleep(sleep)
+
+    save_checkpoint(key, last_pk, rows, completed=True, using=using)
+    if stdout is not None:
+        stdout.write("{}: completed ({} rows)\n".format(key, rows))
+    return rows
+
+
+def init_worker():
+    # worker processes which are not forked need to load the apps.
+    django.setup()
+
+
+def backfill_task(Model, fields, pk_range, batch_size, sleep, using, stdout):
+    """
+    Run `backfill_model()`, return a tuple `(label, pk_range, rows, seconds)`.
+
+    If `stdout` is `True`, the progress is written to the standard output of the (worker)
+    process.
+    """
+    if stdout is True:
+        stdout = sys.stdout
+
+    started = time.monotonic()
+    rows = backfill_model(
+        Model,
+        fields,
+        batch_size=batch_size,
+        sleep=sleep,
+        using=using,
+        stdout=stdout,
+        pk_range=pk_range,
+    )
+    return Model._meta.label, pk_range, rows, time.monotonic() - started
+
+
+def run_backfill(
+    models,
+    batch_size=1000,
+    sleep=0,
+    using=DEFAULT_DB_ALIAS,
+    workers=1,
+    range_size=None,
+    stdout=None,
+):
+    """
+    Run `backfill_model()` for each of `models`, a list of `(Model, fields)` tuples.
+
+    With more than one worker, the models are copied in a pool of `workers` processes, each
+    using its own database connection. If `range_size` is given, models with an integer
+    primary key are split into ranges of `range_size` primary keys, copied as separate tasks.
+
+    Arguments:
+        stdout: if given, a stream to write the progress to. Worker processes cannot share
+            it, they write the progress to their own standard output instead.
+
+    Returns:
+        A list of `(label, pk_range, rows, seconds)` tuples, one for each task.
+    """
+    tasks = []
+    for Model, fields in models:
+        pk_ranges = [None] if range_size is None else get_pk_ranges(Model, range_size, using)
+        for pk_range in pk_ranges:
+            tasks.append((Model, tuple(fields), pk_range, batch_size, sleep, using))
+
+    if workers <= 1:
+        return [backfill_task(*task, stdout) for task in tasks]
+
+    # do not share the connections of this process with the workers.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        stdout = None if stdout is None else True
+        futures = [executor.submit(backfill_task, *task, stdout) for task in tasks]
+        return [future.result() for future in futures]
@@ -1,25 +1,133 @@
 import itertools
+from collections import namedtuple
+from types import MappingProxyType
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Django settings influencing the language configuration, besides the MODELTRANS_* ones.
+LANGUAGE_SETTINGS = ("LANGUAGE_CODE", "LANGUAGES")
+
+_language_config = None
+
+
+class LanguageConfig(
+    namedtuple(
+        "LanguageConfig",
+        (
+            "default_language",
+            "available_languages",
+            "languages",
+            "translation_languages",
+            "fallback",
+            "fallback_chains",
+            "add_field_help_text",
+            "use_fallback_function",
+        ),
+    )
+):
+    """
+    Immutable, precomputed version of the language related settings.
+
+    Attributes:
+        default_language (str): the default language.
+        available_languages (frozenset): all available languages, including the default language.
+        languages (tuple): same as `available_languages`, as a tuple.
+        translation_languages (tuple): available languages, excluding the default language.
+        fallback (mapping): the ``MODELTRANS_FALLBACK`` setting as configured.
+        fallback_chains (mapping): the fallback chain for each language in ``fallback``,
+            without duplicate languages.
+        add_field_help_text (bool): value of the ``MODELTRANS_ADD_FIELD_HELP_TEXT`` setting.
+        use_fallback_function (bool): value of the ``MODELTRANS_USE_FALLBACK_FUNCTION`` setting.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_settings(cls):
+        default_language = _get_default_language_setting()
+        translation_languages = tuple(get_available_languages_setting())
+        available_languages = frozenset(itertools.chain(translation_languages, (default_language,)))
+
+        fallback = getattr(settings, "MODELTRANS_FALLBACK", {"default": (default_language,)})
+        fallback_chains = {lang: tuple(dict.fromkeys(chain)) for lang, chain in fallback.items()}
+        fallback_chains.setdefault("default", (default_language,))
+
+        return cls(
+            default_language=default_language,
+            available_languages=available_languages,
+            languages=tuple(available_languages),
+            translation_languages=translation_languages,
+            fallback=MappingProxyType(dict(fallback)),
+            fallback_chains=MappingProxyType(fallback_chains),
+            add_field_help_text=getattr(settings, "MODELTRANS_ADD_FIELD_HELP_TEXT", True),
+            use_fallback_function=getattr(settings, "MODELTRANS_USE_FALLBACK_FUNCTION", False),
+        )
+
+    def get_fallback_chain(self, lang):
+        try:
+            return self.fallback_chains[lang]
+        except KeyError:
+            return self.fallback_chains["default"]
+
+
+def get_language_config():
+    """
+    Return the `LanguageConfig` for the current settings.
+
+    The configuration is built once and reused until one of the relevant settings changes.
+    """
+    global _language_config
+
+    if _language_config is None:
+        _language_config = LanguageConfig.from_settings()
+    return _language_config
+
+
+def load_language_config():
+    """
+    (Re)build the language configuration from the settings.
+    """
+    global _language_config
+
+    _language_config = None
+    return get_language_config()
+
+
+@receiver(setting_changed)
+def reset_language_config(setting, **kwargs):
+    """
+    Discard the language configuration if a relevant setting changes, it will be
+    rebuilt on next use.
+    """
+    global _language_config
+
+    if setting.startswith("MODELTRANS_") or setting in LANGUAGE_SETTINGS:
+        _language_config = None
 
 
 def get_modeltrans_setting(key):
+    config = get_language_config()
     modeltrans_settings = {
-        "MODELTRANS_AVAILABLE_LANGUAGES": get_available_languages(),
-        "MODELTRANS_FALLBACK": getattr(
-            settings, "MODELTRANS_FALLBACK", {"default": (get_default_language(),)}
-        ),
-        "MODELTRANS_ADD_FIELD_HELP_TEXT": getattr(settings, "MODELTRANS_ADD_FIELD_HELP_TEXT", True),
-        "MODELTRANS_DEFAULT_LANGUAGE": get_default_language(),
+        "MODELTRANS_AVAILABLE_LANGUAGES": config.languages,
+        "MODELTRANS_FALLBACK": config.fallback,
+        "MODELTRANS_ADD_FIELD_HELP_TEXT": config.add_field_help_text,
+        "MODELTRANS_DEFAULT_LANGUAGE": config.default_language,
+        "MODELTRANS_USE_FALLBACK_FUNCTION": config.use_fallback_function,
     }
     return modeltrans_settings.get(key)
 
 
-def get_default_language():
+def _get_default_language_setting():
     return getattr(settings, "MODELTRANS_DEFAULT_LANGUAGE", getattr(settings, "LANGUAGE_CODE"))
 
 
+def get_default_language():
+    return get_language_config().default_language
+
+
 def get_available_languages_setting():
     """
     list of available languages for modeltrans translations.
@@ -41,26 +149,25 @@ def get_available_languages_setting():
         )
 
     # make sure LANGUAGE_CODE is not in available languages
-    return (lang for lang in languages if lang != get_default_language())
+    default_language = _get_default_language_setting()
+    return (lang for lang in languages if lang != default_language)
 
 
 def get_available_languages(include_default=True):
     """
     Returns a tuple of available languages for django-modeltrans.
     """
-    MODELTRANS_AVAILABLE_LANGUAGES = get_available_languages_setting()
+    config = get_language_config()
 
     if include_default:
-        return tuple(
-            set(itertools.chain(MODELTRANS_AVAILABLE_LANGUAGES, (get_default_language(),)))
-        )
+        return config.languages
     else:
-        return MODELTRANS_AVAILABLE_LANGUAGES
+        return config.translation_languages
 
 
 def check_fallback_chain():
     MODELTRANS_FALLBACK = get_modeltrans_setting("MODELTRANS_FALLBACK")
-    MODELTRANS_AVAILABLE_LANGUAGES = get_available_languages(include_default=True)
+    MODELTRANS_AVAILABLE_LANGUAGES = get_language_config().available_languages
 
     if "default" not in MODELTRANS_FALLBACK:
         raise ImproperlyConfigured("MODELTRANS_FALLBACK setting must have a `default` key.")
@@ -91,9 +198,4 @@ def get_fallback_chain(lang):
            'fy': ('nl', 'en')
         }
     """
-    MODELTRANS_FALLBACK = get_modeltrans_setting("MODELTRANS_FALLBACK")
-
-    if lang not in MODELTRANS_FALLBACK.keys():
-        lang = "default"
-
-    return MODELTRANS_FALLBACK[lang]
+    return get_language_config().get_fallback_chain(lang)
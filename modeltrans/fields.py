@@ -1,12 +1,27 @@
 from django.core.exceptions import ImproperlyConfigured
-from django.db.models import F, JSONField, fields
+from django.db.models import Case, F, JSONField, Q, Value, When, fields
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.json import KeyTextTransform
-from django.db.models.functions import Cast, Coalesce
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.functional import cached_property
 from django.utils.translation import gettext
 
-from .conf import get_default_language, get_fallback_chain, get_modeltrans_setting
+try:
+    from django.db.models import GeneratedField
+except ImportError:
+    # Django < 5.0
+    GeneratedField = None
+
+from .conf import get_default_language, get_fallback_chain, get_language_config
 from .utils import (
+    FALLBACK_FUNCTION_MAX_KEYS,
+    ActiveLanguageExpression,
+    FallbackFunction,
     FallbackTransform,
+    JSONBConcat,
+    JSONBRemoveKeys,
+    build_generated_fieldname,
     build_localized_fieldname,
     get_instance_field_value,
     get_language,
@@ -17,6 +32,106 @@ SUPPORTED_FIELDS = (fields.CharField, fields.TextField, JSONField)
 
 DEFAULT_LANGUAGE = get_default_language()
 
+# Name of the instance attribute holding the resolved `<field>_i18n` values
+# for models using `TranslationField(cache_translations=True)`.
+I18N_CACHE_ATTNAME = "_i18n_cache"
+
+
+# Name of the instance attribute holding the keys of the `i18n` field loaded for
+# instances fetched using `MultilingualQuerySet.only_languages()`.
+I18N_LOADED_KEYS_ATTNAME = "_i18n_loaded_keys"
+
+# Name of the instance attribute holding the keys of the `i18n` field assigned through translated
+# fields since the instance was loaded or saved. Missing if `i18n` itself was assigned.
+I18N_DIRTY_KEYS_ATTNAME = "_i18n_dirty_keys"
+
+# Name of the instance attribute holding the keys of the `i18n` field to write while saving with
+# `update_fields` containing translated fields.
+I18N_UPDATE_KEYS_ATTNAME = "_i18n_update_keys"
+
+
+# Name of the instance attribute holding a copy of the `i18n` field as loaded from (or last saved
+# to) the database.
+I18N_SNAPSHOT_ATTNAME = "_i18n_snapshot"
+
+
+def take_i18n_snapshot(instance, keys=None):
+    """
+    Keep a copy of the `i18n` field of a model instance to compare with later, if loaded and
+    `skip_unchanged` is enabled for the model.
+
+    If `keys` is given, only these keys were written to the database, so only these keys of
+    the previous snapshot are updated.
+    """
+    if not instance._meta.get_field("i18n").skip_unchanged:
+        return
+    if "i18n" not in instance.__dict__:
+        instance.__dict__.pop(I18N_SNAPSHOT_ATTNAME, None)
+        return
+
+    value = instance.__dict__["i18n"] or {}
+    if keys is None:
+        instance.__dict__[I18N_SNAPSHOT_ATTNAME] = dict(value)
+        return
+
+    snapshot = instance.__dict__.get(I18N_SNAPSHOT_ATTNAME)
+    if snapshot is None:
+        # the other keys in the database are unknown.
+        return
+    for key in keys:
+        if value.get(key) is None:
+            snapshot.pop(key, None)
+        else:
+            snapshot[key] = value[key]
+
+
+def changed_translation_keys(instance):
+    """
+    Return the set of keys in the `i18n` field of a model instance which were added, changed or
+    removed since it was loaded from (or last saved to) the database.
+
+    All keys are returned for instances not saved yet, none if the `i18n` field is not loaded.
+    Values are compared shallowly, so nested values (for translated `JSONField`) mutated in
+    place are not detected.
+    """
+    if "i18n" not in instance.__dict__:
+        return set()
+
+    value = instance.__dict__["i18n"] or {}
+    snapshot = instance.__dict__.get(I18N_SNAPSHOT_ATTNAME)
+    if snapshot is None:
+        return set(value)
+
+    return {
+        key
+        for key in value.keys() | snapshot.keys()
+        if key not in value or key not in snapshot or value[key] != snapshot[key]
+    }
+
+
+def i18n_has_changed(instance):
+    """
+    Return `True` if the `i18n` field of a model instance changed since it was loaded from (or
+    last saved to) the database.
+    """
+    if "i18n" not in instance.__dict__:
+        return False
+
+    value = instance.__dict__["i18n"] or {}
+    snapshot = instance.__dict__.get(I18N_SNAPSHOT_ATTNAME)
+    if snapshot is None:
+        return bool(value)
+    return value != snapshot
+
+
+def clear_translation_cache(instance):
+    """
+    Clear the cached `<field>_i18n` values of a model instance, if any.
+    """
+    cache = instance.__dict__.get(I18N_CACHE_ATTNAME)
+    if cache:
+        cache.clear()
+
 
 def translated_field_factory(original_field, language=None, *args, **kwargs):
     if not isinstance(original_field, SUPPORTED_FIELDS):
@@ -57,6 +172,14 @@ class TranslatedVirtualField:
         self.concrete = False
         self._help_text = kwargs.pop("help_text", None)
 
+        # language -> "<original_field>_<language>", shared between the virtual fields of
+        # an original field and filled by `modeltrans.translator.add_virtual_fields()`.
+        self.localized_fieldnames = {}
+
+        # (language, bare_lookup, fallback) -> expression, see `as_expression()`.
+        self._expression_cache = {}
+        self._expression_cache_config = None
+
     @property
     def original_name(self):
         return self.original_field.name
@@ -66,7 +189,7 @@ class TranslatedVirtualField:
         if self._help_text is not None:
             return self._help_text
 
-        if get_modeltrans_setting("MODELTRANS_ADD_FIELD_HELP_TEXT") and self.language is None:
+        if get_language_config().add_field_help_text and self.language is None:
             return gettext("current language: {}").format(get_language())
 
     def contribute_to_class(self, cls, name):
@@ -88,6 +211,18 @@ class TranslatedVirtualField:
     def db_type(self, connection):
         return None
 
+    def get_localized_fieldname(self, language):
+        """
+        Return the name of the key in `i18n` (and of the virtual field) for `language`.
+
+        Uses the precomputed names, only building a new one for languages not known at
+        registration time (for example a per-record fallback language).
+        """
+        try:
+            return self.localized_fieldnames[language]
+        except KeyError:
+            return build_localized_fieldname(self.original_name, language)
+
     def get_instance_fallback_chain(self, instance, language):
         """
         Return the fallback chain for the instance.
@@ -108,18 +243,56 @@ class TranslatedVirtualField:
 
         return default
 
+    @cached_property
+    def record_fallback_language_field(self):
+        """
+        Name of the `fallback_language_field` the cached `<field>_i18n` values depend on, if it
+        is a field of the model itself, else `None`.
+        """
+        fallback_language_field = self.model._meta.get_field("i18n").fallback_language_field
+        if not fallback_language_field or LOOKUP_SEP in fallback_language_field:
+            return None
+        return fallback_language_field
+
+    def get_record_fallback_language(self, instance):
+        """
+        Return the value of the `fallback_language_field` of the instance the cached
+        `<field>_i18n` values depend on, if it is a field of the model itself.
+
+        Changes to a `fallback_language_field` on a related model are not detected.
+        """
+        if self.record_fallback_language_field is None:
+            return None
+        return instance.__dict__.get(self.record_fallback_language_field)
+
     def __get__(self, instance, instance_type=None):
         # This method is apparently called with instance=None from django.
         # django-hstor raises AttributeError here, but that doesn't solve our problem.
         if instance is None:
             return
 
-        if "i18n" in instance.get_deferred_fields():
+        language = self.get_language()
+
+        # Return a value resolved earlier for this language if neither the original field,
+        # i18n nor the per-record fallback language were assigned since.
+        cache = instance.__dict__.get(I18N_CACHE_ATTNAME)
+        if cache and self.language is None:
+            cached = cache.get((self.name, language))
+            if (
+                cached is not None
+                and cached[0] is instance.__dict__.get(self.original_name)
+                and cached[1] is instance.__dict__.get("i18n")
+                and cached[2] == self.get_record_fallback_language(instance)
+            ):
+                return cached[3]
+
+        # Same check as `"i18n" in instance.get_deferred_fields()`, without iterating
+        # all concrete fields of the model on every access.
+        if "i18n" not in instance.__dict__:
             raise ValueError(
                 "Getting translated values on a model fetched with defer('i18n') is not supported."
             )
 
-        language = self.get_language()
         original_value = getattr(instance, self.original_name)
         if language == DEFAULT_LANGUAGE and original_value:
             return original_value
@@ -128,14 +301,26 @@ class TranslatedVirtualField:
         if instance.i18n is None:
             instance.i18n = {}
 
-        field_name = build_localized_fieldname(self.original_name, language)
-
         # Just return the value if this is an explicit field (<name>_<lang>)
         if self.language is not None:
-            return instance.i18n.get(field_name)
+            return instance.i18n.get(self.get_localized_fieldname(language))
+
+        value = self._get_fallback_value(instance, language, original_value)
+
+        cache = instance.__dict__.get(I18N_CACHE_ATTNAME)
+        if cache is not None:
+            cache[(self.name, language)] = (
+                original_value,
+                instance.i18n,
+                self.get_record_fallback_language(instance),
+                value,
+            )
+        return value
 
-        # This is the _i18n version of the field, and the current language is not available,
-        # so we walk the fallback chain:
+    def _get_fallback_value(self, instance, language, original_value):
+        """
+        Return the value for the _i18n version of the field, walking the fallback chain.
+        """
         for fallback_language in (language,) + self.get_instance_fallback_chain(instance, language):
             if fallback_language == DEFAULT_LANGUAGE:
                 if original_value:
@@ -143,23 +328,25 @@ class TranslatedVirtualField:
                 else:
                     continue
 
-            field_name = build_localized_fieldname(self.original_name, fallback_language)
-            if field_name in instance.i18n and instance.i18n[field_name]:
-                return instance.i18n.get(field_name)
+            value = instance.i18n.get(self.get_localized_fieldname(fallback_language))
+            if value:
+                return value
 
         # finally, return the original field if all else fails.
-        return getattr(instance, self.original_name)
+        return original_value
 
     def __set__(self, instance, value):
         if instance.i18n is None:
             instance.i18n = {}
 
+        clear_translation_cache(instance)
+
         language = self.get_language()
 
         if language == DEFAULT_LANGUAGE:
             setattr(instance, self.original_name, value)
         else:
-            field_name = build_localized_fieldname(self.original_name, language)
+            field_name = self.get_localized_fieldname(language)
 
             # if value is None, remove field from `i18n`.
             if value is None:
@@ -167,6 +354,10 @@ class TranslatedVirtualField:
             else:
                 instance.i18n[field_name] = value
 
+            dirty_keys = instance.__dict__.get(I18N_DIRTY_KEYS_ATTNAME)
+            if dirty_keys is not None:
+                dirty_keys.add(field_name)
+
     def get_field_name(self):
         """
         Returns the field name for the current virtual field.
@@ -203,10 +394,27 @@ class TranslatedVirtualField:
 
         return Field()
 
+    def get_generated_fieldname(self, language):
+        """
+        Return the name of the generated column holding the value for `language`, or `None`
+        if there is no such column.
+        """
+        i18n_field = self.model._meta.get_field("i18n")
+        if language in i18n_field.generated_languages and isinstance(
+            self.original_field, (fields.CharField, fields.TextField)
+        ):
+            return build_generated_fieldname(self.original_name, language)
+
     def _localized_lookup(self, language, bare_lookup):
         if language == DEFAULT_LANGUAGE:
             return bare_lookup.replace(self.name, self.original_name)
 
+        # Use the generated column if it exists, it is cheaper and can use a plain index.
+        if isinstance(language, str):
+            generated_fieldname = self.get_generated_fieldname(language)
+            if generated_fieldname is not None:
+                return bare_lookup.replace(self.name, generated_fieldname)
+
         # When accessing a table directly, the i18_lookup will be just "i18n", while following relations
         # they are in the lookup first.
         i18n_lookup = bare_lookup.replace(self.name, "i18n")
@@ -217,28 +425,71 @@ class TranslatedVirtualField:
             field_prefix = build_localized_fieldname(self.original_name, "")
             return FallbackTransform(field_prefix, language, i18n_lookup)
         else:
-            return KeyTextTransform(
-                build_localized_fieldname(self.original_name, language), i18n_lookup
-            )
+            return KeyTextTransform(self.get_localized_fieldname(language), i18n_lookup)
 
     def as_expression(self, bare_lookup, fallback=True):
         """
         Compose an expression to get the value for this virtual field in a query.
+
+        Expressions are composed once per language, lookup and value of `fallback`, and copied
+        on subsequent calls. The cache is discarded if the language configuration changes.
         """
+        config = get_language_config()
+        if self._expression_cache_config is not config:
+            self._expression_cache_config = config
+            self._expression_cache = {}
+
         language = self.get_language()
+        key = (language, bare_lookup, fallback)
+        try:
+            expression = self._expression_cache[key]
+        except KeyError:
+            expression = self._expression_cache[key] = self._compose_expression(
+                language, bare_lookup, fallback
+            )
+
+        if isinstance(expression, F):
+            # F() expressions are not altered when used in a query.
+            return expression
+        return expression.copy()
+
+    def as_query_expression(self, bare_lookup, fallback=True):
+        """
+        Return the expression to use in a query for this virtual field.
+
+        For ``<field>_i18n``, the expression is composed when the query is compiled, so that
+        querysets built in advance use the language active when they are evaluated.
+        """
+        if self.language is None:
+            return ActiveLanguageExpression(self, bare_lookup, fallback)
+        return self.as_expression(bare_lookup, fallback)
+
+    def _compose_expression(self, language, bare_lookup, fallback):
         if language == DEFAULT_LANGUAGE:
             return F(self._localized_lookup(language, bare_lookup))
 
         if not fallback:
             i18n_lookup = self._localized_lookup(language, bare_lookup)
+            if isinstance(i18n_lookup, str):
+                return F(i18n_lookup)
             return Cast(i18n_lookup, self.output_field())
 
         fallback_chain = get_fallback_chain(language)
+        i18n_field = self.model._meta.get_field("i18n")
+        # The function is only used with constant keys: keys depending on the row, like the
+        # per-row fallback language, would be evaluated again for every key looked up.
+        if (
+            get_language_config().use_fallback_function
+            and isinstance(self.original_field, (fields.CharField, fields.TextField))
+            and not i18n_field.fallback_language_field
+            and len(fallback_chain) < FALLBACK_FUNCTION_MAX_KEYS
+        ):
+            return self._fallback_function_expression(language, fallback_chain, bare_lookup)
+
         # First, add the current language to the list of lookups
         lookups = [self._localized_lookup(language, bare_lookup)]
 
         # Optionnally add the lookup for the per-row fallback language
-        i18n_field = self.model._meta.get_field("i18n")
         if i18n_field.fallback_language_field:
             lookups.append(
                 self._localized_lookup(F(i18n_field.fallback_language_field), bare_lookup)
@@ -249,6 +500,92 @@ class TranslatedVirtualField:
             lookups.append(self._localized_lookup(fallback_language, bare_lookup))
         return Coalesce(*lookups, output_field=self.output_field())
 
+    def _fallback_function_expression(self, language, fallback_chain, bare_lookup):
+        """
+        Compose the same lookups as `as_expression()` as a single call to the SQL function
+        installed by `modeltrans.operations.CreateFallbackFunction`.
+        """
+
+        def key(language):
+            if language == DEFAULT_LANGUAGE:
+                return Value("")
+            return Value(self.get_localized_fieldname(language))
+
+        keys = [key(language)]
+        keys.extend(key(fallback_language) for fallback_language in fallback_chain)
+
+        return FallbackFunction(
+            F(bare_lookup.replace(self.name, "i18n")),
+            keys,
+            F(self._localized_lookup(DEFAULT_LANGUAGE, bare_lookup)),
+            output_field=self.output_field(),
+        )
+
+    def as_fallback_expression(self):
+        """
+        Compose an expression resolving the value of this field for the active language
+        the same way ``__get__()`` does: empty values are skipped while walking the fallback chain.
+
+        Only supported for text fields, and for lookups on the model itself.
+        """
+        if not isinstance(self.original_field, (fields.CharField, fields.TextField)):
+            raise ValueError(
+                "Resolving {} values in the database is not supported.".format(
+                    self.original_field.__class__.__name__
+                )
+            )
+
+        def non_empty(expression):
+            return NullIf(expression, Value(""), output_field=self.output_field())
+
+        original = F(self.original_name)
+
+        def localized_value(language):
+            if language == DEFAULT_LANGUAGE:
+                return non_empty(original)
+            return non_empty(KeyTextTransform(self.get_localized_fieldname(language), "i18n"))
+
+        language = self.get_language()
+        lookups = [localized_value(language)]
+
+        i18n_field = self.model._meta.get_field("i18n")
+        fallback_language_field = i18n_field.fallback_language_field
+        if fallback_language_field:
+            field_prefix = build_localized_fieldname(self.original_name, "")
+            lookups.append(
+                Case(
+                    When(
+                        Q(**{fallback_language_field: DEFAULT_LANGUAGE}), then=non_empty(original)
+                    ),
+                    default=non_empty(
+                        FallbackTransform(field_prefix, F(fallback_language_field), "i18n")
+                    ),
+                )
+            )
+
+        for fallback_language in get_fallback_chain(language):
+            lookups.append(localized_value(fallback_language))
+
+        # finally, use the original field if all else fails.
+        lookups.append(original)
+        return Coalesce(*lookups, output_field=self.output_field())
+
+
+class TranslationFieldDescriptor(DeferredAttribute):
+    """
+    Descriptor for the `i18n` field of models using `TranslationField(cache_translations=True)`
+    or `TranslationField(partial_updates=True)`.
+
+    Assigning a new value to `i18n` resets the cache of resolved `<field>_i18n` values, and
+    marks all keys as changed.
+    """
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+        if self.field.cache_translations:
+            instance.__dict__[I18N_CACHE_ATTNAME] = {}
+        instance.__dict__.pop(I18N_DIRTY_KEYS_ATTNAME, None)
+
 
 class TranslationField(JSONField):
     """
@@ -268,6 +605,25 @@ class TranslationField(JSONField):
             For example: if you have a model instance with 'nl' as language_code, and set
             fallback_language_field='language_code', 'nl' will always be tried after the current
             language before any other language.
+        cache_translations (bool): If `True`, the values of the `<field>_i18n` virtual fields are
+            cached on the model instance per active language. The cache is cleared when assigning
+            a translated field or `i18n` and when calling `refresh_from_db()`, and cached values
+            are ignored after assigning a `fallback_language_field` of the model itself. Mutating
+            the `i18n` dict in place or a `fallback_language_field` on a related model is not
+            detected.
+        partial_updates (bool): If `True`, saving an existing instance only writes the keys of
+            `i18n` assigned through translated fields since it was loaded, keeping changes made
+            to other keys in the meantime. Changes made to the `i18n` dict in place are not
+            detected, assign `i18n` to write all keys.
+        skip_unchanged (bool): If `True`, instances keep a copy of `i18n` as loaded from the
+            database, see `changed_translation_keys()`, and saving an existing instance leaves
+            `i18n` out of the `UPDATE` if its value did not change. Such a `save()` passes
+            `update_fields` to the `pre_save` and `post_save` signals, and raises `DatabaseError`
+            instead of inserting the row again if it was deleted in the meantime.
+        generated_languages (iterable): Languages to add a stored generated column
+            ``<field>_<lang>_gen`` for, for each translated ``CharField`` and ``TextField``.
+            Lookups for these languages use the column instead of extracting the value from
+            `i18n`. Requires Django 5.0 or later.
     """
 
     description = "Translation storage for a model"
@@ -278,13 +634,29 @@ class TranslationField(JSONField):
         required_languages=None,
         virtual_fields=True,
         fallback_language_field=None,
+        cache_translations=False,
+        partial_updates=False,
+        skip_unchanged=False,
+        generated_languages=None,
         *args,
         **kwargs,
     ):
+        if generated_languages and GeneratedField is None:
+            raise ImproperlyConfigured(
+                'Argument "generated_languages" to TranslationField requires Django 5.0 or later.'
+            )
+
         self.fields = fields or ()
         self.required_languages = required_languages or ()
         self.virtual_fields = virtual_fields
         self.fallback_language_field = fallback_language_field
+        self.cache_translations = cache_translations
+        self.partial_updates = partial_updates
+        self.skip_unchanged = skip_unchanged
+        self.generated_languages = tuple(generated_languages or ())
+
+        if cache_translations or partial_updates:
+            self.descriptor_class = TranslationFieldDescriptor
 
         kwargs["editable"] = False
         kwargs["null"] = True
@@ -298,9 +670,44 @@ class TranslationField(JSONField):
         kwargs["fields"] = self.fields
         kwargs["required_languages"] = self.required_languages
         kwargs["virtual_fields"] = self.virtual_fields
+        if self.fallback_language_field:
+            kwargs["fallback_language_field"] = self.fallback_language_field
+        if self.generated_languages:
+            kwargs["generated_languages"] = self.generated_languages
 
         return name, path, args, kwargs
 
+    def pre_save(self, model_instance, add):
+        """
+        Only update some of the keys of an existing row if:
+
+         - `model_instance` is saved with translated fields in `update_fields`,
+         - `partial_updates` is enabled, updating the keys assigned through translated fields,
+         - `model_instance` was fetched using `MultilingualQuerySet.only_languages()`, updating
+           the keys which were loaded (or added).
+        """
+        value = super().pre_save(model_instance, add)
+        if add:
+            return value
+
+        keys = model_instance.__dict__.get(I18N_UPDATE_KEYS_ATTNAME)
+        if keys is None and self.partial_updates:
+            keys = model_instance.__dict__.get(I18N_DIRTY_KEYS_ATTNAME)
+        if keys is None:
+            loaded_keys = model_instance.__dict__.get(I18N_LOADED_KEYS_ATTNAME)
+            if loaded_keys is None:
+                return value
+            keys = set(loaded_keys).union(value or ())
+
+        value = value or {}
+        return JSONBConcat(
+            JSONBRemoveKeys(Coalesce(F(self.attname), Value({}, output_field=self)), keys),
+            Value(
+                {key: value[key] for key in keys if value.get(key) is not None},
+                output_field=self,
+            ),
+        )
+
     def get_translated_fields(self):
         """Return a generator for all translated fields."""
         for field in self.model._meta.get_fields():
@@ -0,0 +1,137 @@
+import copy
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import F, Index
+
+from .conf import get_available_languages
+from .fields import translated_field_factory
+from .utils import build_localized_fieldname
+
+
+class TranslatedIndexMixin:
+    """
+    Mixin for indexes on a translated field, using the same expression as a
+    `MultilingualQuerySet` generates to filter or order on that field.
+
+    Arguments:
+        field_name (str): Name of the translated field, either ``<field>_<lang>`` to index
+            the value for that language, or ``<field>_i18n`` to index the value including the
+            fallback chain for `language`.
+        language (str): The language to index ``<field>_i18n`` for.
+        opclasses (iterable): Name of the operator class to use for the expression, at most one.
+
+    The expression depends on the fallback chain configured in the settings, so the index
+    needs to be recreated if that is changed.
+    """
+
+    def __init__(self, field_name, language=None, *, name, opclasses=(), **kwargs):
+        if field_name.endswith("_i18n") and language is None:
+            raise ValueError(
+                '{} on "{}" requires a language.'.format(self.__class__.__name__, field_name)
+            )
+        if len(opclasses) > 1:
+            raise ValueError(
+                "{} supports at most one operator class.".format(self.__class__.__name__)
+            )
+
+        # The actual expression can only be created for a model, this placeholder is also
+        # used by Django to check the fields the index references.
+        super().__init__(F("i18n"), name=name, **kwargs)
+
+        self.field_name = field_name
+        self.language = language
+        self.opclasses = tuple(opclasses)
+
+    def deconstruct(self):
+        path, expressions, kwargs = super().deconstruct()
+        if self.language is not None:
+            kwargs["language"] = self.language
+
+        return path, (self.field_name,), kwargs
+
+    def _get_virtual_field(self, model):
+        """
+        Return a virtual field for `model` generating the expression for this index.
+        """
+        i18n_field = model._meta.get_field("i18n")
+
+        for original_name in i18n_field.fields:
+            if self.field_name == build_localized_fieldname(original_name, "i18n"):
+                language, fallback = self.language, True
+                break
+
+            language = next(
+                (
+                    language
+                    for language in get_available_languages()
+                    if self.field_name == build_localized_fieldname(original_name, language)
+                ),
+                None,
+            )
+            if language is not None:
+                fallback = False
+                if self.language not in (None, language):
+                    raise ImproperlyConfigured(
+                        '{} on "{}" cannot have language "{}".'.format(
+                            self.__class__.__name__, self.field_name, self.language
+                        )
+                    )
+                break
+        else:
+            raise ImproperlyConfigured(
+                '{} refers to "{}", which is not a translated field of "{}".'.format(
+                    self.__class__.__name__, self.field_name, model.__name__
+                )
+            )
+
+        original_field = model._meta.get_field(original_name)
+        field = translated_field_factory(
+            original_field, language, blank=True, null=original_field.null
+        )
+        field.model = model
+        field.name = self.field_name
+
+        return field, fallback
+
+    def get_expression(self, model):
+        """
+        Return the expression to index for `model`.
+        """
+        field, fallback = self._get_virtual_field(model)
+        expression = field.as_expression(bare_lookup=field.name, fallback=fallback)
+
+        if self.opclasses:
+            expression = OpClass(expression, name=self.opclasses[0])
+        return expression
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        index = copy.copy(self)
+        index.expressions = (self.get_expression(model),)
+        index.opclasses = ()
+
+        return super(TranslatedIndexMixin, index).create_sql(
+            model, schema_editor, using=using, **kwargs
+        )
+
+
+class TranslatedIndex(TranslatedIndexMixin, Index):
+    """
+    B-tree index on a translated field, for example to order by ``title_i18n`` in Dutch::
+
+        class Blog(models.Model):
+            title = models.CharField(max_length=255)
+
+            i18n = TranslationField(fields=("title",))
+
+            class Meta:
+                indexes = [TranslatedIndex("title_i18n", language="nl", name="blog_title_nl")]
+    """
+
+
+class TranslatedGinIndex(TranslatedIndexMixin, GinIndex):
+    """
+    GIN index on a translated field, for example to search with trigrams::
+
+        TranslatedGinIndex("title_nl", opclasses=["gin_trgm_ops"], name="blog_title_nl_trgm")
+    """
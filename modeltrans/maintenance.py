@@ -0,0 +1,241 @@
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Case, Count, F, Func, IntegerField, JSONField, Q, Sum, Value, When
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.json import KeyTransform
+
+from .conf import get_default_language
+from .translator import get_translated_models
+from .utils import JSONBBuildObject, JSONBConcat, JSONBRemoveKeys, build_localized_fieldname
+
+# Policies for `rename_language()` for rows which already have a translation in the new language.
+RENAME_CONFLICT_POLICIES = ("keep", "overwrite", "error")
+
+
+def get_translated_tables():
+    """
+    Yield a tuple `(Model, i18n_field)` for each installed model with a `TranslationField`,
+    once for each database table.
+    """
+    for app_config in apps.get_app_configs():
+        for Model in get_translated_models(app_config.label):
+            i18n_field = Model._meta.get_field("i18n")
+            # proxy models and models inheriting i18n share the table of another model.
+            if Model._meta.proxy or not Model._meta.managed or i18n_field.model is not Model:
+                continue
+            yield Model, i18n_field
+
+
+def get_language_keys(i18n_field, language):
+    """
+    Return the keys in `i18n` for the translations in `language`.
+    """
+    return [build_localized_fieldname(field, language) for field in i18n_field.fields]
+
+
+def raise_if_default_language(language):
+    if language == get_default_language():
+        raise ValueError(
+            'Language "{}" is the default language, which is not stored in i18n.'.format(language)
+        )
+
+
+def update_in_batches(queryset, updates, batch_size=1000, stdout=None):
+    """
+    Update the rows in `queryset` with `updates` (the kwargs to `QuerySet.update()`), in batches
+    of `batch_size` rows ordered by primary key, each committed separately.
+
+    Returns:
+        The number of rows updated.
+    """
+    queryset = queryset.order_by("pk")
+    label = queryset.model._meta.label
+
+    rows = 0
+    batch = queryset
+    while True:
+        pks = batch.values_list("pk", flat=True)
+        try:
+            last_pk = pks[batch_size - 1]
+        except IndexError:
+            last_pk = pks.last()
+            if last_pk is None:
+                break
+
+        with transaction.atomic(using=queryset.db):
+            rows += batch.filter(pk__lte=last_pk).update(**updates)
+        batch = queryset.filter(pk__gt=last_pk)
+
+        if stdout is not None:
+            stdout.write("{}: {} rows updated\n".format(label, rows))
+
+    return rows
+
+
+def drop_language(language, batch_size=1000, dry_run=False, using=DEFAULT_DB_ALIAS, stdout=None):
+    """
+    Remove the translations in `language` from the `i18n` field of all translated models.
+
+    Arguments:
+        language (str): the language code to remove, for example a language no longer in
+            `MODELTRANS_AVAILABLE_LANGUAGES`.
+        batch_size (int): number of rows to update per transaction.
+        dry_run (bool): if `True`, do not change anything, only estimate the number of rows
+            and the number of bytes saved.
+        using (str): alias of the database to update.
+        stdout: if given, a stream to write the progress of the updates to.
+
+    Returns:
+        A dict mapping the model label to a tuple `(rows, bytes)`. `bytes` is the estimated
+        reduction of the size of `i18n` for a dry run, `None` otherwise.
+    """
+    raise_if_default_language(language)
+
+    results = {}
+    for Model, i18n_field in get_translated_tables():
+        keys = get_language_keys(i18n_field, language)
+        queryset = Model._base_manager.using(using).filter(i18n__has_any_keys=keys)
+        label = Model._meta.label
+
+        if dry_run:
+            estimate = queryset.aggregate(
+                rows=Count("pk"),
+                bytes=Sum(
+                    Func(F("i18n"), function="pg_column_size", output_field=IntegerField())
+                    - Func(
+                        JSONBRemoveKeys(F("i18n"), keys),
+                        function="pg_column_size",
+                        output_field=IntegerField(),
+                    )
+                ),
+            )
+            results[label] = (estimate["rows"], estimate["bytes"] or 0)
+        else:
+            rows = update_in_batches(
+                queryset,
+                {"i18n": JSONBRemoveKeys(F("i18n"), keys)},
+                batch_size=batch_size,
+                stdout=stdout,
+            )
+            results[label] = (rows, None)
+
+    return results
+
+
+def rename_language(
+    old_language,
+    new_language,
+    conflict="error",
+    batch_size=1000,
+    using=DEFAULT_DB_ALIAS,
+    stdout=None,
+):
+    """
+    Rename the keys in the `i18n` field of all translated models from `old_language` to
+    `new_language`, for example from `zh` to `zh-hans`. Values of a `fallback_language_field`
+    on the translated model itself equal to `old_language` are changed too.
+
+    Arguments:
+        old_language (str): the language code to rename.
+        new_language (str): the new language code.
+        conflict (str): what to do with rows having a translation in both languages:
+            `"keep"` keeps the translation in `new_language`, `"overwrite"` replaces it with the
+            translation in `old_language` and `"error"` raises a `ValueError` before changing
+            any rows. With `"error"`, rows getting translations in both languages while
+            renaming are left unchanged.
+        batch_size (int): number of rows to update per transaction.
+        using (str): alias of the database to update.
+        stdout: if given, a stream to write the progress of the updates to.
+
+    Returns:
+        A dict mapping the model label to the number of rows updated.
+    """
+    if conflict not in RENAME_CONFLICT_POLICIES:
+        raise ValueError(
+            'Argument "conflict" must be one of {}, not "{}".'.format(
+                ", ".join(RENAME_CONFLICT_POLICIES), conflict
+            )
+        )
+    raise_if_default_language(old_language)
+    raise_if_default_language(new_language)
+
+    tables = []
+    for Model, i18n_field in get_translated_tables():
+        old_keys = get_language_keys(i18n_field, old_language)
+        new_keys = get_language_keys(i18n_field, new_language)
+        if old_keys == new_keys:
+            raise ValueError(
+                'Languages "{}" and "{}" use the same keys in i18n.'.format(
+                    old_language, new_language
+                )
+            )
+        tables.append((Model, i18n_field, old_keys, new_keys))
+
+    if conflict == "error":
+        for Model, i18n_field, old_keys, new_keys in tables:
+            count = (
+                Model._base_manager.using(using).filter(get_conflicts(old_keys, new_keys)).count()
+            )
+            if count:
+                raise ValueError(
+                    '{} rows of "{}" have translations in both "{}" and "{}".'.format(
+                        count, Model._meta.label, old_language, new_language
+                    )
+                )
+
+    results = {}
+    for Model, i18n_field, old_keys, new_keys in tables:
+        renamed = JSONBConcat(
+            *[
+                Case(
+                    When(
+                        i18n__has_key=old_key,
+                        then=JSONBBuildObject({new_key: KeyTransform(old_key, "i18n")}),
+                    ),
+                    default=Value({}, output_field=JSONField()),
+                )
+                for old_key, new_key in zip(old_keys, new_keys)
+            ]
+        )
+        remaining = JSONBRemoveKeys(F("i18n"), old_keys)
+        if conflict == "keep":
+            # keys in the rightmost value take precedence.
+            i18n = JSONBConcat(renamed, remaining)
+        else:
+            i18n = JSONBConcat(remaining, renamed)
+
+        rows = Q(i18n__has_any_keys=old_keys)
+        updates = {"i18n": i18n}
+
+        # fallback_language_field on a related model is renamed with that model, if translated.
+        fallback_language_field = i18n_field.fallback_language_field
+        if fallback_language_field and LOOKUP_SEP not in fallback_language_field:
+            rows |= Q(**{fallback_language_field: old_language})
+            updates[fallback_language_field] = Case(
+                When(**{fallback_language_field: old_language, "then": Value(new_language)}),
+                default=F(fallback_language_field),
+            )
+
+        if conflict == "error":
+            # skip rows written concurrently since checking for conflicts.
+            rows &= ~get_conflicts(old_keys, new_keys)
+
+        results[Model._meta.label] = update_in_batches(
+            Model._base_manager.using(using).filter(rows),
+            updates,
+            batch_size=batch_size,
+            stdout=stdout,
+        )
+
+    return results
+
+
+def get_conflicts(old_keys, new_keys):
+    """
+    Return a `Q` object matching rows having a translation for both a key in `old_keys` and
+    the corresponding key in `new_keys`.
+    """
+    conflicts = Q()
+    for old_key, new_key in zip(old_keys, new_keys):
+        conflicts |= Q(i18n__has_key=old_key) & Q(i18n__has_key=new_key)
+    return conflicts
@@ -0,0 +1,91 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = (
+        "Copies the values of the fields managed by django-modeltranslation into i18n for the "
+        "specified apps, in small batches, resuming where a previous run stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("apps", nargs="+", type=str)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to copy per transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Number of seconds to wait between batches.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to backfill. Defaults to the "default" database.',
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Forget the progress of previous runs and start from the beginning.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes copying models (or ranges of rows) in parallel.",
+        )
+        parser.add_argument(
+            "--range-size",
+            type=int,
+            default=None,
+            help="Split models with an integer primary key into ranges of this many keys.",
+        )
+
+    def handle(self, *args, **options):
+        from modeltrans.backfill import create_checkpoint_table, delete_checkpoints, run_backfill
+        from modeltrans.migration import get_translatable_models, get_translated_fields
+
+        using = options["database"]
+        models = [
+            Model for Model in get_translatable_models() if Model._meta.app_label in options["apps"]
+        ]
+        if not models:
+            self.stdout.write("No models registered for translation with django-modeltranslation")
+            return
+
+        create_checkpoint_table(using=using)
+        if options["reset"]:
+            delete_checkpoints(models, using=using)
+
+        started = time.monotonic()
+        results = run_backfill(
+            [(Model, tuple(get_translated_fields(Model))) for Model in models],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            using=using,
+            workers=options["workers"],
+            range_size=options["range_size"],
+            stdout=self.stdout if options["verbosity"] > 0 else None,
+        )
+        self.write_report(results, time.monotonic() - started)
+
+    def write_report(self, results, elapsed):
+        totals = {}
+        for label, pk_range, rows, seconds in results:
+            tasks, total_rows, total_seconds = totals.get(label, (0, 0, 0))
+            totals[label] = (tasks + 1, total_rows + rows, total_seconds + seconds)
+
+        self.stdout.write("{:<40} {:>12} {:>6} {:>10}".format("Model", "Rows", "Tasks", "Seconds"))
+        for label, (tasks, rows, seconds) in sorted(totals.items()):
+            self.stdout.write("{:<40} {:>12} {:>6} {:>10.1f}".format(label, rows, tasks, seconds))
+        self.stdout.write(
+            "Copied {} rows for {} models in {:.1f} seconds".format(
+                sum(rows for tasks, rows, seconds in totals.values()), len(totals), elapsed
+            )
+        )
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = "Removes the translations in a language from the i18n field of all translated models."
+
+    def add_arguments(self, parser):
+        parser.add_argument("language", type=str)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to update per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of rows and bytes the translations use.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to update. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        from modeltrans.maintenance import drop_language
+
+        try:
+            results = drop_language(
+                options["language"],
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+                using=options["database"],
+                stdout=self.stdout if options["verbosity"] > 1 else None,
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        if options["dry_run"]:
+            for label, (rows, size) in results.items():
+                if rows:
+                    self.stdout.write("{}: {} rows, {} bytes".format(label, rows, size))
+            self.stdout.write(
+                "Would remove translations from {} rows, saving about {} bytes".format(
+                    sum(rows for rows, size in results.values()),
+                    sum(size for rows, size in results.values()),
+                )
+            )
+        else:
+            self.stdout.write(
+                "Removed translations from {} rows".format(
+                    sum(rows for rows, size in results.values())
+                )
+            )
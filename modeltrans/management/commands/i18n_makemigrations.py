@@ -8,15 +8,24 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("apps", nargs="+", type=str)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Number of rows to copy per UPDATE statement in the data migration.",
+        )
 
     def handle(self, *args, **options):
         from modeltrans.migration import (
             I18nDataMigration,
+            get_migration_loader,
             get_translatable_models,
             get_translated_fields,
         )
 
         models = get_translatable_models()
+        # building the loader imports all migrations, share it for all apps.
+        loader = get_migration_loader()
 
         apps = defaultdict(list)
         for model in models:
@@ -28,7 +37,7 @@ class Command(BaseCommand):
             if len(apps[app]) == 0:
                 print("No models registered for translation with django-modeltranslation")
                 break
-            migration = I18nDataMigration(app)
+            migration = I18nDataMigration(app, batch_size=options["batch_size"], loader=loader)
 
             for Model in apps[app]:
                 translatable_fields = tuple(get_translated_fields(Model))
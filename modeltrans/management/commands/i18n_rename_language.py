@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = "Renames a language code in the i18n field of all translated models."
+
+    def add_arguments(self, parser):
+        from modeltrans.maintenance import RENAME_CONFLICT_POLICIES
+
+        parser.add_argument("old_language", type=str)
+        parser.add_argument("new_language", type=str)
+        parser.add_argument(
+            "--conflict",
+            choices=RENAME_CONFLICT_POLICIES,
+            default="error",
+            help=(
+                "What to do with rows having translations in both languages: keep the "
+                "translation in the new language, overwrite it, or stop before changing anything."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows to update per transaction.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to update. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        from modeltrans.maintenance import rename_language
+
+        try:
+            results = rename_language(
+                options["old_language"],
+                options["new_language"],
+                conflict=options["conflict"],
+                batch_size=options["batch_size"],
+                using=options["database"],
+                stdout=self.stdout if options["verbosity"] > 1 else None,
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        self.stdout.write("Renamed translations in {} rows".format(sum(results.values())))
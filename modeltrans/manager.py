@@ -1,11 +1,37 @@
 from django.core.exceptions import FieldDoesNotExist
-from django.db.models import Count, Func, Manager, Q, QuerySet
+from django.db.models import (
+    DEFERRED,
+    CharField,
+    Count,
+    Func,
+    JSONField,
+    Manager,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+)
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.expressions import CombinedExpression, F, OrderBy
-from django.db.models.functions import Cast
-
-from .conf import get_default_language
-from .fields import TranslatedVirtualField
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.query import ModelIterable
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
+
+from .conf import get_default_language, get_fallback_chain
+from .fields import (
+    I18N_CACHE_ATTNAME,
+    I18N_DIRTY_KEYS_ATTNAME,
+    I18N_LOADED_KEYS_ATTNAME,
+    TranslatedVirtualField,
+)
+from .utils import (
+    JSONBBuildObject,
+    JSONBConcat,
+    JSONBRemoveKeys,
+    build_localized_fieldname,
+    get_language,
+)
 
 
 def transform_translatable_fields(model, fields):
@@ -56,6 +82,177 @@ def transform_translatable_fields(model, fields):
     return ret
 
 
+# Maximum number of lookups kept per model by `resolve_lookup()`. The cache is a bounded dict,
+# cleared completely when full rather than evicting the least recently used lookups.
+LOOKUP_CACHE_SIZE = 2048
+
+# Name of the attribute of `Model._meta` holding the cached lookups of a model, stored on the
+# model so the cache does not keep models alive (like the models created in tests).
+LOOKUP_CACHE_ATTNAME = "_modeltrans_lookup_cache"
+
+# Incremented by `clear_lookup_cache()` to invalidate the caches of all models.
+lookup_cache_version = 0
+
+
+class LookupCache:
+    def __init__(self, version):
+        self.version = version
+        self.lookups = {}
+        self.roots = None
+
+
+def get_lookup_cache(model):
+    cache = getattr(model._meta, LOOKUP_CACHE_ATTNAME, None)
+    if cache is None or cache.version != lookup_cache_version:
+        cache = LookupCache(lookup_cache_version)
+        setattr(model._meta, LOOKUP_CACHE_ATTNAME, cache)
+    return cache
+
+
+def resolve_lookup(model, lookup):
+    """
+    Return the Django model field for a lookup on `model` plus the remainder of the lookup,
+    which should be the lookup type.
+
+    Results are cached per model, up to `LOOKUP_CACHE_SIZE` lookups. The cache is cleared by
+    `clear_lookup_cache()` when models are added to the app registry or translated.
+    """
+    lookups = get_lookup_cache(model).lookups
+    try:
+        return lookups[lookup]
+    except KeyError:
+        pass
+
+    if len(lookups) >= LOOKUP_CACHE_SIZE:
+        lookups.clear()
+    result = lookups[lookup] = _resolve_lookup(model, lookup)
+    return result
+
+
+def _resolve_lookup(model, lookup):
+    lookup_type = None
+
+    # pk is not an actual field, but an alias for the implicit id field.
+    if lookup == "pk":
+        key = None
+        for field in model._meta.get_fields():
+            if getattr(field, "primary_key", False):
+                key = field
+        return key, None
+
+    field = None
+    bits = lookup.split(LOOKUP_SEP)
+
+    for i, bit in enumerate(bits):
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            lookup_type = LOOKUP_SEP.join(bits[i:])
+            break
+
+        if hasattr(field, "remote_field"):
+            rel = getattr(field, "remote_field", None)
+            model = getattr(rel, "model", model)
+
+    return field, lookup_type
+
+
+def has_translated_fields(model):
+    """
+    Return True if `model` or any model reachable through its relations has translated fields.
+    """
+    seen = set()
+    models = [model]
+    while models:
+        model = models.pop()
+        if isinstance(model, str):
+            # Unresolved relation, assume the worst.
+            return True
+        if model is None or model in seen:
+            continue
+        seen.add(model)
+
+        if any(isinstance(field, TranslatedVirtualField) for field in model._meta.private_fields):
+            return True
+        models.extend(
+            field.related_model for field in model._meta.get_fields() if field.is_relation
+        )
+
+    return False
+
+
+def get_translated_lookup_roots(model):
+    """
+    Return the names which can start a lookup on `model` referring to a translated field:
+    the translated virtual fields of `model` and the relations leading to translated fields.
+
+    Lookups starting with any other name do not need to be rewritten.
+    """
+    cache = get_lookup_cache(model)
+    if cache.roots is not None:
+        return cache.roots
+
+    roots = set()
+    for field in model._meta.get_fields():
+        if isinstance(field, TranslatedVirtualField):
+            roots.add(field.name)
+        elif field.is_relation and has_translated_fields(field.related_model):
+            roots.add(field.name)
+
+    cache.roots = frozenset(roots)
+    return cache.roots
+
+
+@receiver(class_prepared)
+def clear_lookup_cache(**kwargs):
+    """
+    Clear the caches of `resolve_lookup()` and `get_translated_lookup_roots()`, adding a model
+    can change the fields reachable through relations.
+    """
+    global lookup_cache_version
+    lookup_cache_version += 1
+
+
+# Name of the annotation used by `MultilingualQuerySet.only_languages()`.
+I18N_PROJECTION_ANNOTATION = "_i18n_projection"
+
+
+class TranslatedModelIterable(ModelIterable):
+    """
+    Iterable yielding model instances which return the values resolved by
+    `MultilingualQuerySet.with_translations()` for their `<field>_i18n` fields,
+    and contain the translations loaded by `MultilingualQuerySet.only_languages()`.
+    """
+
+    def __iter__(self):
+        translated_annotations = self.queryset._translated_annotations
+        loaded_keys = self.queryset._i18n_loaded_keys
+        virtual_fields = {
+            field_name: self.queryset.model._meta.get_field(field_name)
+            for annotation_name, field_name, original_name, language in translated_annotations
+        }
+
+        for obj in super().__iter__():
+            if loaded_keys is not None:
+                obj.__dict__["i18n"] = obj.__dict__.pop(I18N_PROJECTION_ANNOTATION)
+                obj.__dict__[I18N_LOADED_KEYS_ATTNAME] = loaded_keys
+
+            if not translated_annotations:
+                yield obj
+                continue
+
+            cache = obj.__dict__.setdefault(I18N_CACHE_ATTNAME, {})
+            for annotation_name, field_name, original_name, language in translated_annotations:
+                value = obj.__dict__.pop(annotation_name)
+                cache[(field_name, language)] = (
+                    obj.__dict__.get(original_name),
+                    obj.__dict__.get("i18n"),
+                    virtual_fields[field_name].get_record_fallback_language(obj),
+                    value,
+                )
+            yield obj
+
+
 class MultilingualQuerySet(QuerySet):
     """
     Extends ``~django.db.models.query.QuerySet`` and makes the translated versions of fields
@@ -71,8 +268,24 @@ class MultilingualQuerySet(QuerySet):
     mixed in to the manager class of that model.
     """
 
+    # (annotation_name, field_name, original_name, language) for values resolved by with_translations()
+    _translated_annotations = ()
+    # keys of the i18n field to load, as set by only_languages()
+    _i18n_loaded_keys = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._translated_annotations = self._translated_annotations
+        clone._i18n_loaded_keys = self._i18n_loaded_keys
+        return clone
+
     def _add_i18n_annotation(
-        self, virtual_field=None, fallback=True, bare_lookup=None, annotation_name=None
+        self,
+        virtual_field=None,
+        fallback=True,
+        bare_lookup=None,
+        annotation_name=None,
+        select=True,
     ):
         """
         Private method to add an annotation to the query to extract the translated
@@ -85,19 +298,21 @@ class MultilingualQuerySet(QuerySet):
             bare_lookup:
             annotation_name (str): name of the annotation, if None the default
                 `<original_field>_<lang>_annotation` will be used.
+            select (bool): If `False`, the annotation is added as an alias: it can be used
+                in filters, but is not added to the `SELECT` clause.
 
         Returns:
             the name of the annotation created.
         """
-        expression = virtual_field.as_expression(fallback=fallback, bare_lookup=bare_lookup)
+        expression = virtual_field.as_query_expression(fallback=fallback, bare_lookup=bare_lookup)
 
-        if isinstance(expression, F):
+        if isinstance(expression, F) and annotation_name is None:
             return expression.name
 
         if annotation_name is None:
             annotation_name = "{}_annotation".format(virtual_field.name)
 
-        self.query.add_annotation(expression, annotation_name)
+        self.query.add_annotation(expression, annotation_name, select=select)
         return annotation_name
 
     def _get_field(self, lookup):
@@ -105,34 +320,38 @@ class MultilingualQuerySet(QuerySet):
         Return the Django model field for a lookup plus the remainder of the lookup,
         which should be the lookup type.
         """
-        model = self.model
-        lookup_type = None
-
-        # pk is not an actual field, but an alias for the implicit id field.
-        if lookup == "pk":
-            key = None
-            for field in model._meta.get_fields():
-                if getattr(field, "primary_key", False):
-                    key = field
-            return key, None
+        return resolve_lookup(self.model, lookup)
 
-        field = None
-        bits = lookup.split(LOOKUP_SEP)
-
-        for i, bit in enumerate(bits):
-            try:
-                field = model._meta.get_field(bit)
-            except FieldDoesNotExist:
-                lookup_type = LOOKUP_SEP.join(bits[i:])
-                break
+    def _is_translated_lookup(self, lookup):
+        """
+        Return True if `lookup` refers to a translated field.
+        """
+        if lookup.split(LOOKUP_SEP, 1)[0] not in get_translated_lookup_roots(self.model):
+            return False
 
-            if hasattr(field, "remote_field"):
-                rel = getattr(field, "remote_field", None)
-                model = getattr(rel, "model", model)
+        # Follow relations, or strip the lookup type from a translated field.
+        field, lookup_type = self._get_field(lookup)
+        return isinstance(field, TranslatedVirtualField)
 
-        return field, lookup_type
+    def _has_translated_references(self, expr):
+        """
+        Return False if `expr` (an expression, `Q` object or `(lookup, value)` tuple) does not
+        refer to any translated field, which means it does not need to be rewritten.
+        """
+        if isinstance(expr, F):
+            return self._is_translated_lookup(expr.name)
+        if isinstance(expr, Q):
+            return any(self._has_translated_references(child) for child in expr.children)
+        if isinstance(expr, tuple) and len(expr) == 2 and isinstance(expr[0], str):
+            lookup, value = expr
+            return self._is_translated_lookup(lookup) or self._has_translated_references(value)
+        if hasattr(expr, "get_source_expressions"):
+            return any(
+                self._has_translated_references(source) for source in expr.get_source_expressions()
+            )
+        return False
 
-    def _rewrite_filter_clause(self, lookup, value):
+    def _rewrite_filter_clause(self, lookup, value, negated=False):
         """
         Rewrite a filter clause passed to filter()/exclude()/etc.
 
@@ -140,6 +359,10 @@ class MultilingualQuerySet(QuerySet):
 
         for title_nl__like="va"
         _rewrite_filter_clause("title_nl__like", "va") should be called.
+
+        Returns a `(lookup, value)` tuple, or a `Q` object if the lookup is rewritten to
+        a lookup on the `i18n` field itself. Negated clauses (`negated=True`) are not rewritten
+        to lookups on `i18n`, see `_rewrite_indexable_lookup()`.
         """
         value = self._rewrite_expression(value)
         field, lookup_type = self._get_field(lookup)
@@ -152,16 +375,101 @@ class MultilingualQuerySet(QuerySet):
         else:
             bare_lookup = lookup
 
+        if not negated:
+            q = self._rewrite_indexable_lookup(field, bare_lookup, lookup_type, value)
+            if q is not None:
+                return q
+
+        # The value is only needed to filter on, so there is no need to select it.
         filter_field_name = self._add_i18n_annotation(
-            virtual_field=field, bare_lookup=bare_lookup, fallback=field.language is None
+            virtual_field=field,
+            bare_lookup=bare_lookup,
+            fallback=field.language is None,
+            select=False,
         )
 
         # re-add lookup type
         if lookup_type is not None:
             filter_field_name += LOOKUP_SEP + lookup_type
 
+        if (
+            lookup_type == "isnull"
+            and value is False
+            and self._is_indexable(field)
+            and not self._is_multi_valued(bare_lookup)
+        ):
+            # `i18n ? 'title_nl'` can use a GIN index, the extraction is still needed to
+            # exclude null values.
+            i18n_lookup = bare_lookup.replace(field.name, "i18n")
+            return Q(**{i18n_lookup + "__has_key": field.name}) & Q(**{filter_field_name: value})
+
         return filter_field_name, value
 
+    def _is_indexable(self, field):
+        """
+        Return True if lookups for the virtual field `field` can be rewritten to
+        lookups on the `i18n` field.
+
+        Languages with a generated column are not rewritten, the column can use a plain index.
+        """
+        return (
+            field.language is not None
+            and field.language != get_default_language()
+            and isinstance(field.original_field, (CharField, TextField))
+            and field.get_generated_fieldname(field.language) is None
+        )
+
+    def _is_multi_valued(self, bare_lookup):
+        """
+        Return True if `bare_lookup` follows a reverse foreign key or many-to-many relation.
+
+        Two lookups combined in a `Q` object use separate joins for such relations, so they
+        could match different related rows.
+        """
+        model = self.model
+        for bit in bare_lookup.split(LOOKUP_SEP)[:-1]:
+            field = model._meta.get_field(bit)
+            if field.many_to_many or field.one_to_many:
+                return True
+            model = field.related_model
+        return False
+
+    def _rewrite_indexable_lookup(self, field, bare_lookup, lookup_type, value):
+        """
+        Rewrite lookups for an explicit language to lookups on the `i18n` field which can use a
+        GIN index on it, if the result is the same:
+
+         - `title_nl="foo"` becomes `i18n @> '{"title_nl": "foo"}'`
+         - `title_nl__in=["foo", "bar"]` becomes
+           `i18n @> '{"title_nl": "foo"}' OR i18n @> '{"title_nl": "bar"}'`
+
+        Returns `None` if the lookup cannot be rewritten.
+
+        Only call this for lookups which are not negated: for `exclude()`, Django adds
+        `i18n IS NOT NULL` to the negated `@>` lookup, which would then include rows without
+        the key or with `i18n` set to NULL.
+        """
+        if not self._is_indexable(field):
+            return None
+
+        i18n_lookup = bare_lookup.replace(field.name, "i18n") + LOOKUP_SEP + "contains"
+
+        if lookup_type in (None, "exact") and isinstance(value, str):
+            return Q(**{i18n_lookup: {field.name: value}})
+
+        if (
+            lookup_type == "in"
+            and isinstance(value, (list, tuple, set))
+            and len(value) > 0
+            and all(isinstance(item, str) for item in value)
+        ):
+            return Q(
+                *(Q(**{i18n_lookup: {field.name: item}}) for item in value),
+                _connector=Q.OR,
+            )
+
+        return None
+
     def _rewrite_expression(self, expr):
         """
         Rewrite expressions.
@@ -176,7 +484,7 @@ class MultilingualQuerySet(QuerySet):
             if not isinstance(field, TranslatedVirtualField):
                 return expr
 
-            return field.as_expression(fallback=field.language is None, bare_lookup=expr.name)
+            return field.as_query_expression(fallback=field.language is None, bare_lookup=expr.name)
         elif isinstance(expr, CombinedExpression):
             expr.lhs = self._rewrite_expression(expr.lhs)
             expr.rhs = self._rewrite_expression(expr.rhs)
@@ -190,16 +498,20 @@ class MultilingualQuerySet(QuerySet):
             expr.expression = self._rewrite_expression(expr.expression)
         return expr
 
-    def _rewrite_Q(self, q):
+    def _rewrite_Q(self, q, negated=False):
+        """
+        Rewrite the clauses in `q`, `negated` is `True` if `q` is inside an odd number of
+        negations, including `exclude()`.
+        """
         if isinstance(q, Q):
             factory = Q.create
             return factory(
-                list(self._rewrite_Q(child) for child in q.children),
+                list(self._rewrite_Q(child, negated != q.negated) for child in q.children),
                 connector=q.connector,
                 negated=q.negated,
             )
         if isinstance(q, (list, tuple)):
-            return self._rewrite_filter_clause(*q)
+            return self._rewrite_filter_clause(*q, negated=negated)
         return q
 
     def _rewrite_ordering(self, field_names):
@@ -229,7 +541,7 @@ class MultilingualQuerySet(QuerySet):
 
             assert lookup_type is None, "{} is not a valid order_by lookup".format(field_name)
 
-            sort_field = field.as_expression(bare_lookup=field_name)
+            sort_field = field.as_query_expression(bare_lookup=field_name)
             if sort_order == "-":
                 sort_field = sort_field.desc()
 
@@ -243,11 +555,262 @@ class MultilingualQuerySet(QuerySet):
 
         https://docs.djangoproject.com/en/stable/ref/models/querysets/#annotate
         """
-        args = [self._rewrite_expression(a) for a in args]
-        kwargs = {alias: self._rewrite_expression(expr) for alias, expr in kwargs.items()}
+        if any(self._has_translated_references(expr) for expr in (*args, *kwargs.values())):
+            args = [self._rewrite_expression(a) for a in args]
+            kwargs = {alias: self._rewrite_expression(expr) for alias, expr in kwargs.items()}
 
         return super().annotate(*args, **kwargs)
 
+    def with_translations(self, *field_names):
+        """
+        Resolve the values of `<field>_i18n` for the currently active language in the database.
+
+        Instances fetched using the returned queryset do not need to walk the fallback chain in
+        python when reading these fields, as long as the same language is active::
+
+            with override("nl"):
+                for blog in Blog.objects.with_translations("title"):
+                    print(blog.title_i18n)
+
+        Assigning a translated field or `i18n` discards the resolved values for that instance.
+
+        Arguments:
+            field_names: names of the translated fields to resolve (for example `"title"` or
+                `"title_i18n"`). If omitted, all translated text fields are resolved.
+        """
+        if field_names:
+            fields = []
+            for field_name in field_names:
+                field, lookup_type = self._get_field(field_name)
+                if not isinstance(field, TranslatedVirtualField) or field.language is not None:
+                    field, lookup_type = self._get_field(
+                        build_localized_fieldname(field_name, "i18n")
+                    )
+                if lookup_type is not None or not isinstance(field, TranslatedVirtualField):
+                    raise ValueError('"{}" is not a translated field.'.format(field_name))
+                fields.append(field)
+        else:
+            fields = [
+                field
+                for field in self.model._meta.private_fields
+                if isinstance(field, TranslatedVirtualField)
+                and field.language is None
+                and isinstance(field.original_field, (CharField, TextField))
+            ]
+
+        annotations = {}
+        translated_annotations = []
+        for field in fields:
+            language = field.get_language()
+            annotation_name = "_{}_resolved".format(field.name)
+
+            annotations[annotation_name] = field.as_fallback_expression()
+            translated_annotations.append(
+                (annotation_name, field.name, field.original_name, language)
+            )
+
+        clone = super().annotate(**annotations)
+        clone._translated_annotations = tuple(
+            item for item in self._translated_annotations if item[0] not in annotations
+        ) + tuple(translated_annotations)
+        if clone._iterable_class is ModelIterable:
+            clone._iterable_class = TranslatedModelIterable
+        return clone
+
+    def only_languages(self, *languages):
+        """
+        Only fetch the translations for `languages` from the `i18n` field.
+
+        If no languages are passed, the active language and its fallback chain are used.
+        Saving an instance fetched this way only updates the keys in `i18n` for the fetched
+        languages (and keys added to `i18n`), leaving the other translations untouched::
+
+            with override("nl"):
+                for blog in Blog.objects.only_languages():
+                    print(blog.title_i18n)
+
+        Arguments:
+            languages: the languages to fetch translations for.
+        """
+        if not languages:
+            if self.model._meta.get_field("i18n").fallback_language_field:
+                raise ValueError(
+                    "only_languages() requires explicit languages for models "
+                    "with a fallback_language_field."
+                )
+            language = get_language()
+            languages = (language,) + get_fallback_chain(language)
+
+        loaded_keys = []
+        excluded_keys = []
+        for field in self.model._meta.private_fields:
+            if not isinstance(field, TranslatedVirtualField) or field.language in (
+                None,
+                get_default_language(),
+            ):
+                continue
+            if field.language in languages:
+                loaded_keys.append(field.name)
+            else:
+                excluded_keys.append(field.name)
+
+        clone = self.defer("i18n")
+        if excluded_keys:
+            expression = JSONBRemoveKeys("i18n", excluded_keys)
+        else:
+            expression = F("i18n")
+        clone.query.add_annotation(expression, I18N_PROJECTION_ANNOTATION)
+
+        clone._i18n_loaded_keys = tuple(loaded_keys)
+        if clone._iterable_class is ModelIterable:
+            clone._iterable_class = TranslatedModelIterable
+        return clone
+
+    def update(self, **kwargs):
+        """
+        Patch update to allow updating translated fields, with the same semantics as
+        assigning to them on an instance.
+
+        Only the keys for the translated fields passed are changed in `i18n`, for example
+        ``update(title_nl="Valk", body_de=None)`` results in::
+
+            UPDATE ... SET "i18n" = (COALESCE("i18n", '{}') - '{body_de}'::text[])
+                || jsonb_build_object('title_nl', 'Valk'::text)
+
+        https://docs.djangoproject.com/en/stable/ref/models/querysets/#update
+        """
+        if not any(self._has_translated_references(item) for item in kwargs.items()):
+            return super().update(**kwargs)
+
+        new_kwargs = {}
+        set_keys = {}
+        removed_keys = []
+        for field_name, value in kwargs.items():
+            field, lookup_type = self._get_field(field_name)
+            if self._has_translated_references(value):
+                value = self._rewrite_expression(value)
+
+            if not isinstance(field, TranslatedVirtualField) or lookup_type is not None:
+                name = field_name
+            elif field.get_language() == get_default_language():
+                name = field.original_name
+            else:
+                key = field.get_localized_fieldname(field.get_language())
+                if value is None:
+                    removed_keys.append(key)
+                else:
+                    set_keys[key] = self._get_i18n_value(field, value)
+                continue
+
+            if name in new_kwargs:
+                raise ValueError(
+                    'Attempted override of "{}" with "{}". '
+                    "Only one of the two is allowed.".format(name, field_name)
+                )
+            new_kwargs[name] = value
+
+        if set_keys or removed_keys:
+            if "i18n" in new_kwargs:
+                raise ValueError("Updating i18n together with translated fields is not allowed.")
+
+            new_kwargs["i18n"] = self._merge_i18n(removed_keys, set_keys)
+
+        return super().update(**new_kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """
+        Patch bulk_update to allow passing translated field names.
+
+        For translated fields, only their keys are updated in `i18n`, using the values in the
+        `i18n` dict of each instance. Translations for other languages are left untouched, as
+        are keys missing from instances fetched with `only_languages()` (unless assigned) or
+        with `i18n` deferred.
+
+        https://docs.djangoproject.com/en/stable/ref/models/querysets/#bulk-update
+        """
+        field_names = []
+        virtual_fields = []
+        for field_name in fields:
+            field, lookup_type = self._get_field(field_name)
+            if not isinstance(field, TranslatedVirtualField) or lookup_type is not None:
+                field_names.append(field_name)
+            elif field.get_language() == get_default_language():
+                field_names.append(field.original_name)
+            else:
+                virtual_fields.append(field)
+
+        if not virtual_fields:
+            return super().bulk_update(objs, field_names, batch_size=batch_size)
+
+        if "i18n" in field_names:
+            raise ValueError("Updating i18n together with translated fields is not allowed.")
+
+        keys = {
+            field.get_localized_fieldname(field.get_language()): field for field in virtual_fields
+        }
+
+        # Temporarily replace the value of i18n with an expression merging the values of the
+        # updated keys, which QuerySet.bulk_update() puts in a CASE statement.
+        objs = tuple(objs)
+        i18n_values = []
+        for obj in objs:
+            i18n = obj.__dict__.get("i18n") or {}
+            i18n_values.append(obj.__dict__.get("i18n", DEFERRED))
+
+            # only remove the keys known to be missing, not the keys which were not loaded.
+            if "i18n" not in obj.__dict__:
+                removed_keys = ()
+            elif I18N_LOADED_KEYS_ATTNAME in obj.__dict__:
+                known_keys = set(obj.__dict__[I18N_LOADED_KEYS_ATTNAME])
+                known_keys.update(obj.__dict__.get(I18N_DIRTY_KEYS_ATTNAME) or ())
+                removed_keys = [key for key in keys if key in known_keys]
+            else:
+                removed_keys = keys
+
+            obj.__dict__["i18n"] = self._merge_i18n(
+                removed_keys,
+                {
+                    key: self._get_i18n_value(field, i18n[key])
+                    for key, field in keys.items()
+                    if i18n.get(key) is not None
+                },
+            )
+
+        try:
+            return super().bulk_update(objs, field_names + ["i18n"], batch_size=batch_size)
+        finally:
+            for obj, i18n in zip(objs, i18n_values):
+                if i18n is DEFERRED:
+                    del obj.__dict__["i18n"]
+                else:
+                    obj.__dict__["i18n"] = i18n
+
+    def _get_i18n_value(self, field, value):
+        """
+        Return an expression for `value` as stored in `i18n` for the virtual field `field`.
+        """
+        if isinstance(field.original_field, (CharField, TextField)):
+            output_field = TextField()
+        else:
+            output_field = JSONField()
+
+        if not hasattr(value, "resolve_expression"):
+            value = Value(value, output_field=output_field)
+        return Cast(value, output_field)
+
+    def _merge_i18n(self, removed_keys, values):
+        """
+        Return an expression for the `i18n` field without `removed_keys`, updated with `values`,
+        a dict of keys to expressions.
+        """
+        i18n_field = self.model._meta.get_field("i18n")
+        expression = Coalesce(F("i18n"), Value({}, output_field=i18n_field))
+        if removed_keys:
+            expression = JSONBRemoveKeys(expression, removed_keys)
+        if values:
+            expression = JSONBConcat(expression, JSONBBuildObject(values))
+        return expression
+
     def create(self, **kwargs):
         """
         Patch the create method to allow adding the value for a translated field
@@ -271,6 +834,16 @@ class MultilingualQuerySet(QuerySet):
         https://docs.djangoproject.com/en/1.11/ref/models/querysets/#order_by
         """
 
+        if not any(
+            (
+                self._is_translated_lookup(field_name.lstrip("-"))
+                if isinstance(field_name, str)
+                else self._has_translated_references(field_name)
+            )
+            for field_name in field_names
+        ):
+            return super().order_by(*field_names)
+
         new_field_names = self._rewrite_ordering(field_names)
 
         return super().order_by(*new_field_names)
@@ -289,10 +862,20 @@ class MultilingualQuerySet(QuerySet):
         In all cases, the field part of the field lookup will be changed to use
         the annotated version.
         """
-        new_args = [Q(self._rewrite_Q(arg)) for arg in args if arg]
-        new_kwargs = dict(
-            self._rewrite_filter_clause(field, value) for field, value in kwargs.items()
-        )
+        if not any(self._has_translated_references(arg) for arg in args) and not any(
+            self._has_translated_references(item) for item in kwargs.items()
+        ):
+            return super()._filter_or_exclude(negate, args, kwargs)
+
+        new_args = [Q(self._rewrite_Q(arg, negate)) for arg in args if arg]
+        new_kwargs = {}
+        for field, value in kwargs.items():
+            clause = self._rewrite_filter_clause(field, value, negated=negate)
+            if isinstance(clause, Q):
+                new_args.append(clause)
+            else:
+                new_kwargs[clause[0]] = clause[1]
+
         return super()._filter_or_exclude(negate, new_args, new_kwargs)
 
     def _values(self, *fields, **expressions):
@@ -308,13 +891,16 @@ class MultilingualQuerySet(QuerySet):
         _fields = fields + tuple(expressions)
 
         for field_name in _fields:
+            if not self._is_translated_lookup(field_name):
+                continue
+
             field, lookup_type = self._get_field(field_name)
             if not isinstance(field, TranslatedVirtualField):
                 continue
 
             fallback = field.language is None
 
-            if field.get_language() == get_default_language():
+            if field.language == get_default_language():
                 original_field = field_name.replace(field.name, field.original_field.name)
                 self.query.add_annotation(Cast(original_field, field.output_field()), field_name)
             else:
@@ -325,7 +911,18 @@ class MultilingualQuerySet(QuerySet):
                     annotation_name=field_name,
                 )
 
-        return super()._values(*fields, **expressions)
+        clone = super()._values(*fields, **expressions)
+        if not fields:
+            # values() without fields selects all annotations, except those added to fetch
+            # model instances.
+            hidden = {item[0] for item in self._translated_annotations}
+            if self._i18n_loaded_keys is not None:
+                hidden.add(I18N_PROJECTION_ANNOTATION)
+            if hidden:
+                clone.query.set_annotation_mask(
+                    name for name in clone.query.annotation_select if name not in hidden
+                )
+        return clone
 
     def __reduce__(self):
         """
@@ -387,3 +984,9 @@ class MultilingualManager(Manager):
             # Is already patched
             return qs
         return self._patch_queryset(qs)
+
+    def with_translations(self, *field_names):
+        return self.get_queryset().with_translations(*field_names)
+
+    def only_languages(self, *languages):
+        return self.get_queryset().only_languages(*languages)
@@ -57,35 +57,116 @@ def get_translated_fields(Model):
             yield translated.name
 
 
-def copy_translations(Model, fields):
+def get_copy_translations_updates(Model, fields):
+    """
+    Return the kwargs to `QuerySet.update()` copying the values of the fields managed by
+    django-modeltranslation into `i18n`, and the value for the default language into the
+    original field. Empty values are not copied.
+
+    Arguments:
+        Model: A (historical) Model from the migraton's app registry
+        fields(iterable): list of fields to copy into their new places.
+    """
+    from django.db.models import F, Func, JSONField, Value
+    from django.db.models.functions import Coalesce, NullIf
+
+    class JSONBConcat(Func):
+        template = "(%(expressions)s)"
+        arg_joiner = " || "
+        output_field = JSONField()
+
+    class JSONBRemoveNullValues(Func):
+        # unlike jsonb_strip_nulls(), keeps null values nested in the values, for JSONFields.
+        template = (
+            "(SELECT COALESCE(jsonb_object_agg(key, value), '{}'::jsonb) "
+            "FROM jsonb_each(%(expressions)s) WHERE value <> 'null'::jsonb)"
+        )
+        output_field = JSONField()
+
+    def get_value(field):
+        # empty strings are not copied, like NULL values.
+        if Model._meta.get_field(field).get_internal_type() in ("CharField", "TextField"):
+            return NullIf(F(field), Value(""))
+        return F(field)
+
+    updates = {}
+    i18n_values = []
+    for field in fields:
+        original_field, lang = split_translated_fieldname(field)
+
+        if lang == DEFAULT_LANGUAGE:
+            updates[original_field] = Coalesce(get_value(field), F(original_field))
+        else:
+            i18n_values.extend((Value(field), get_value(field)))
+
+    # jsonb_build_object() accepts at most 100 arguments, concatenate multiple objects if needed.
+    objects = [
+        Func(*i18n_values[i : i + 100], function="jsonb_build_object", output_field=JSONField())
+        for i in range(0, len(i18n_values), 100)
+    ]
+    if not objects:
+        updates["i18n"] = Value({}, output_field=JSONField())
+    else:
+        updates["i18n"] = JSONBRemoveNullValues(
+            objects[0] if len(objects) == 1 else JSONBConcat(*objects)
+        )
+
+    return updates
+
+
+def copy_translations(Model, fields, batch_size=10000, using=None, verbose=False):
     """
     Copy translations for all items in the database for a Model with
     translations managed by django-modeltranslation into a json field `i18n`
     managed by django-modeltrans.
     Values for the default language will be copied to the original field.
 
+    The values are copied with an `UPDATE` statement for each batch of `batch_size` rows,
+    ordered by primary key, without loading the rows.
+
     Arguments:
         Model: A (historical) Model from the migraton's app registry
         fields(iterable): list of fields to copy into their new places.
+        batch_size(int): number of rows to update per statement.
+        using(str): alias of the database to update.
+        verbose(bool): if `True`, print the number of rows copied after each batch.
     """
-    for m in Model.objects.all():
-        m.i18n = {}
-        for field in fields:
-            value = getattr(m, field)
-            if value in (None, ""):
-                continue
+    updates = get_copy_translations_updates(Model, fields)
+
+    queryset = Model.objects.using(using).order_by("pk")
+    total = queryset.count() if verbose else None
+    copied = 0
+
+    batch = queryset
+    while True:
+        try:
+            last_pk = batch.values_list("pk", flat=True)[batch_size - 1]
+        except IndexError:
+            copied += batch.update(**updates)
+            break
+
+        copied += batch.filter(pk__lte=last_pk).update(**updates)
+        batch = queryset.filter(pk__gt=last_pk)
 
-            original_field, lang = split_translated_fieldname(field)
+        if verbose:
+            print("  {}: copied {} of {} rows".format(Model.__name__, copied, total))
 
-            if lang == DEFAULT_LANGUAGE:
-                setattr(m, original_field, value)
-            else:
-                m.i18n[field] = value
+    if verbose:
+        print("  {}: copied {} rows".format(Model.__name__, copied))
 
-        m.save()
 
+def get_migration_loader(connection=None):
+    """
+    Return a `MigrationLoader` for `connection`, which can be shared by multiple calls to
+    `get_latest_migration()` as building it imports all migrations.
+    """
+    if connection is None:
+        connection = connections[DEFAULT_DB_ALIAS]
 
-def get_latest_migration(app_name, connection=None):
+    return MigrationLoader(connection, ignore_no_migrations=True)
+
+
+def get_latest_migration(app_name, connection=None, loader=None):
     """
     Get the name of the latest applied migration and raises if unapplied
     migrations exist for the app.
@@ -93,13 +174,14 @@ def get_latest_migration(app_name, connection=None):
     Arguments:
         app_name(str): Name of the app.
         connection: database connection to get the latest migration for.
+        loader: `MigrationLoader` to use, see `get_migration_loader()`. A new one is created for
+            `connection` if not given.
     Simplified version of
     https://github.com/django/django/blob/1.9.2/django/core/management/commands/showmigrations.py#L38-L77
     """
-    if connection is None:
-        connection = connections[DEFAULT_DB_ALIAS]
+    if loader is None:
+        loader = get_migration_loader(connection)
 
-    loader = MigrationLoader(connection, ignore_no_migrations=True)
     graph = loader.graph
     last = None
     shown = set()
@@ -115,11 +197,11 @@ def get_latest_migration(app_name, connection=None):
     return last
 
 
-def get_next_migration_filename(app_name, connection=None, migration_type="data"):
+def get_next_migration_filename(app_name, connection=None, migration_type="data", loader=None):
     """
     Return name (including the absolute path) of the next migration to insert for this app
     """
-    latest_migration_name = get_latest_migration(app_name)
+    latest_migration_name = get_latest_migration(app_name, connection, loader=loader)
     next_migration_name = "{:04d}_i18n_{}_migration.py".format(
         int(latest_migration_name[0:4]) + 1, migration_type
     )
@@ -141,6 +223,7 @@ DEFAULT_LANGUAGE = "{DEFAULT_LANGUAGE}"
 
 
 class Migration(migrations.Migration):
+    atomic = {atomic}
 
     dependencies = [
         ("{app}", "{last_migration}"),
@@ -151,12 +234,15 @@ class Migration(migrations.Migration):
     ]
 """
 
-    def __init__(self, app):
+    def __init__(self, app, atomic=True, loader=None):
         self.models = []
         self.app = app
+        self.atomic = atomic
+        self.loader = loader if loader is not None else get_migration_loader()
 
         self.migration_filename = (
-            get_latest_migration(self.app) or "# TODO: manually insert latest migration here"
+            get_latest_migration(self.app, loader=self.loader)
+            or "# TODO: manually insert latest migration here"
         )
 
     def get_helper_functions(self):
@@ -191,6 +277,7 @@ class Migration(migrations.Migration):
                 timestamp=now().strftime("%Y-%m-%d %H:%M"),
                 helpers=self.get_helper_src(),
                 app=self.app,
+                atomic=self.atomic,
                 last_migration=self.migration_filename,
                 operations=self.get_operations(),
             )
@@ -200,7 +287,9 @@ class Migration(migrations.Migration):
         """
         Write the migration to file.
         """
-        filename = get_next_migration_filename(self.app, migration_type=self.migration_type)
+        filename = get_next_migration_filename(
+            self.app, migration_type=self.migration_type, loader=self.loader
+        )
         with open(filename, "w") as f:
             self.write(f)
 
@@ -208,8 +297,20 @@ class Migration(migrations.Migration):
 
 
 class I18nDataMigration(I18nMigration):
+    """
+    Data migration copying the values of the fields managed by django-modeltranslation into
+    the `i18n` field, in batches of `batch_size` rows.
+
+    The migration is not atomic by default, so each batch is committed separately. Copying is
+    idempotent, so an interrupted migration can simply be applied again.
+    """
+
     migration_type = "data"
-    helper_functions = (split_translated_fieldname, copy_translations)
+    helper_functions = (
+        split_translated_fieldname,
+        get_copy_translations_updates,
+        copy_translations,
+    )
 
     forwards_template = """
 def forwards(apps, schema_editor):
@@ -221,15 +322,26 @@ def forwards(apps, schema_editor):
     for model, fields in todo:
         Model = apps.get_model(app, model)
 
-        copy_translations(Model, fields)
+        copy_translations(
+            Model,
+            fields,
+            batch_size={batch_size},
+            using=schema_editor.connection.alias,
+            verbose=True,
+        )
 """
 
+    def __init__(self, app, batch_size=10000, atomic=False, loader=None):
+        super().__init__(app, atomic=atomic, loader=loader)
+        self.batch_size = batch_size
+
     def get_extra_helper_functions(self):
         yield self.forwards_template.format(
             todo=",\n        ".join(
                 [str((Model.__name__, fields)) for Model, fields in self.models]
             ),
             app=self.app,
+            batch_size=self.batch_size,
         )
 
     def get_operations(self):
@@ -0,0 +1,62 @@
+from django.db.migrations import RunSQL
+
+from .utils import FALLBACK_FUNCTION, FALLBACK_FUNCTION_MAX_KEYS
+
+# Return the first non-null value for `keys` in `i18n`, where an empty key refers to
+# `original` (the value for the default language) and a NULL key is skipped.
+#
+# The body is a single expression, so PostgreSQL inlines the function into the query: with
+# constant keys, the planner reduces it to the same expression as a `COALESCE()` of the keys.
+# Keys past the end of the array are NULL and skipped.
+FALLBACK_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION {name}(i18n jsonb, keys text[], original text)
+RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$
+    SELECT COALESCE(
+        {lookups}
+    )
+$$;
+""".format(
+    name=FALLBACK_FUNCTION,
+    lookups=",\n        ".join(
+        "CASE WHEN keys[{0}] = '' THEN original ELSE i18n ->> keys[{0}] END".format(i)
+        for i in range(1, FALLBACK_FUNCTION_MAX_KEYS + 1)
+    ),
+)
+
+DROP_FALLBACK_FUNCTION_SQL = "DROP FUNCTION IF EXISTS {name}(jsonb, text[], text);".format(
+    name=FALLBACK_FUNCTION
+)
+
+
+class CreateFallbackFunction(RunSQL):
+    """
+    Migration operation installing the SQL function used for translated fields with
+    ``MODELTRANS_USE_FALLBACK_FUNCTION = True``, add it to a migration of your app::
+
+        from modeltrans.operations import CreateFallbackFunction
+
+
+        class Migration(migrations.Migration):
+            operations = [CreateFallbackFunction()]
+
+    The function is created with ``CREATE OR REPLACE``, so it can be added to multiple apps.
+    """
+
+    def __init__(self, hints=None, elidable=False):
+        super().__init__(
+            FALLBACK_FUNCTION_SQL, DROP_FALLBACK_FUNCTION_SQL, hints=hints, elidable=elidable
+        )
+
+    def deconstruct(self):
+        kwargs = {}
+        if self.hints:
+            kwargs["hints"] = self.hints
+        if self.elidable:
+            kwargs["elidable"] = self.elidable
+
+        return self.__class__.__name__, [], kwargs
+
+    def describe(self):
+        return "Create SQL function {}".format(FALLBACK_FUNCTION)
@@ -1,11 +1,26 @@
+import sys
+
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
-from django.db.models import Manager
+from django.db.models import Manager, fields
+from django.db.models.fields.json import KeyTextTransform
 
 from .conf import get_available_languages, get_default_language
-from .fields import TranslationField, translated_field_factory
-from .manager import MultilingualManager, transform_translatable_fields
-from .utils import get_model_field
+from .fields import (
+    I18N_DIRTY_KEYS_ATTNAME,
+    I18N_LOADED_KEYS_ATTNAME,
+    I18N_UPDATE_KEYS_ATTNAME,
+    GeneratedField,
+    TranslatedVirtualField,
+    TranslationField,
+    changed_translation_keys,
+    clear_translation_cache,
+    i18n_has_changed,
+    take_i18n_snapshot,
+    translated_field_factory,
+)
+from .manager import MultilingualManager, clear_lookup_cache, transform_translatable_fields
+from .utils import build_generated_fieldname, build_localized_fieldname, get_model_field
 
 
 def get_i18n_field(Model):
@@ -64,7 +79,13 @@ def translate_model(Model):
     fields_to_translate = get_i18n_field_param(Model, i18n_field, "fields")
     required_languages = get_i18n_field_param(Model, i18n_field, "required_languages")
     add_virtual_fields(Model, fields_to_translate, required_languages)
+    add_generated_fields(Model, fields_to_translate, i18n_field.generated_languages)
     patch_constructor(Model)
+    patch_refresh_from_db(Model)
+    patch_save(Model)
+    if i18n_field.skip_unchanged:
+        add_change_tracking_methods(Model)
+    clear_lookup_cache()
 
     translate_meta_ordering(Model)
 
@@ -100,6 +121,15 @@ def validate(Model):
                 "which is not an existing field.".format(i18n_field.fallback_language_field)
             )
 
+    for lang in i18n_field.generated_languages:
+        if lang not in get_available_languages(include_default=False):
+            raise ImproperlyConfigured(
+                'Language "{}" is in generated_languages on Model "{}" but not in '
+                "settings.MODELTRANS_AVAILABLE_LANGUAGES, or is the default language.".format(
+                    lang, Model.__name__
+                )
+            )
+
     if i18n_field.required_languages:
         required_languages = i18n_field.required_languages
         allowed_types = (tuple, list, set)
@@ -151,6 +181,13 @@ def add_virtual_fields(Model, fields, required_languages):
 
         original_field = Model._meta.get_field(field_name)
 
+        # names of the virtual fields/keys in i18n for each language, shared by all
+        # virtual fields for this original field.
+        localized_fieldnames = {
+            language: sys.intern(build_localized_fieldname(field_name, language))
+            for language in get_available_languages()
+        }
+
         # first, add a `<original_field_name>_i18n` virtual field to get the currently
         # active translation for a field
         field = translated_field_factory(
@@ -161,6 +198,7 @@ def add_virtual_fields(Model, fields, required_languages):
         )
 
         raise_if_field_exists(Model, field.get_field_name())
+        field.localized_fieldnames = localized_fieldnames
         field.contribute_to_class(Model, field.get_field_name())
 
         # add a virtual field pointing to the original field with name
@@ -173,6 +211,7 @@ def add_virtual_fields(Model, fields, required_languages):
             editable=False,
         )
         raise_if_field_exists(Model, field.get_field_name())
+        field.localized_fieldnames = localized_fieldnames
         field.contribute_to_class(Model, field.get_field_name())
 
         # now, for each language, add a virtual field to get the tranlation for
@@ -187,9 +226,35 @@ def add_virtual_fields(Model, fields, required_languages):
                 null=blank_allowed and original_field.null,
             )
             raise_if_field_exists(Model, field.get_field_name())
+            field.localized_fieldnames = localized_fieldnames
             field.contribute_to_class(Model, field.get_field_name())
 
 
+def add_generated_fields(Model, field_names, generated_languages):
+    """
+    Add a stored generated column ``<field>_<lang>_gen`` containing the value of
+    ``i18n.<field>_<lang>`` for each text field in `field_names` and each language in
+    `generated_languages`.
+    """
+    for field_name in field_names:
+        original_field = Model._meta.get_field(field_name)
+        if not isinstance(original_field, (fields.CharField, fields.TextField)):
+            continue
+
+        for language in generated_languages:
+            generated_fieldname = build_generated_fieldname(field_name, language)
+            raise_if_field_exists(Model, generated_fieldname)
+
+            field = GeneratedField(
+                expression=KeyTextTransform(
+                    build_localized_fieldname(field_name, language), "i18n"
+                ),
+                output_field=fields.TextField(null=True),
+                db_persist=True,
+            )
+            field.contribute_to_class(Model, generated_fieldname)
+
+
 def has_custom_queryset(manager):
     """
     Check whether manager (or its parents) has declared some custom get_queryset method.
@@ -258,11 +323,140 @@ def patch_constructor(model):
     old_init = model.__init__
 
     def patched_init(self, *args, **kwargs):
-        old_init(self, *args, **transform_translatable_fields(self.__class__, kwargs))
+        i18n_assigned = "i18n" in kwargs
+        kwargs = transform_translatable_fields(self.__class__, kwargs)
+        old_init(self, *args, **kwargs)
+
+        # keep track of the keys in i18n assigned using translated fields, unless i18n itself
+        # was assigned.
+        if not i18n_assigned:
+            self.__dict__[I18N_DIRTY_KEYS_ATTNAME] = set(kwargs.get("i18n", None) or ())
+
+        # Model.from_db() passes the values loaded from the database as positional arguments.
+        if args:
+            take_i18n_snapshot(self)
 
     model.__init__ = patched_init
 
 
+def patch_refresh_from_db(model):
+    """
+    Monkey patches the original model to clear the cached translations in refresh_from_db(),
+    and to forget about the partially loaded i18n field if it is reloaded.
+    """
+    old_refresh_from_db = model.refresh_from_db
+
+    def patched_refresh_from_db(self, using=None, fields=None, *args, **kwargs):
+        old_refresh_from_db(self, using, fields, *args, **kwargs)
+        if fields is None or "i18n" in fields:
+            self.__dict__.pop(I18N_LOADED_KEYS_ATTNAME, None)
+            self.__dict__[I18N_DIRTY_KEYS_ATTNAME] = set()
+            take_i18n_snapshot(self)
+        clear_translation_cache(self)
+
+    model.refresh_from_db = patched_refresh_from_db
+
+
+def translate_update_fields(Model, update_fields):
+    """
+    Return a tuple of `update_fields` with the translated field names replaced by the original
+    field (for the default language) or `i18n`, and the keys in `i18n` to update.
+
+    The keys are `None` if `i18n` is in `update_fields`, in which case all keys are written.
+    """
+    field_names, keys = [], set()
+    for field_name in update_fields:
+        try:
+            field = Model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            field = None
+
+        if isinstance(field, TranslatedVirtualField) and field.language is not None:
+            if field.language == get_default_language():
+                field_name = field.original_name
+            else:
+                keys.add(field.get_localized_fieldname(field.language))
+                field_name = "i18n"
+
+        if field_name not in field_names:
+            field_names.append(field_name)
+
+    if "i18n" in update_fields:
+        keys = None
+    return field_names, keys
+
+
+def patch_save(model):
+    """
+    Monkey patches the original model to allow translated field names in the `update_fields`
+    argument to save(), only updating their keys in the i18n field.
+    """
+    if getattr(model.save, "patched_by_modeltrans", False):
+        # inherited from a translated parent model.
+        return
+
+    old_save = model.save
+
+    def patched_save(self, *args, update_fields=None, **kwargs):
+        keys = None
+        adding = self._state.adding
+        if update_fields is not None:
+            update_fields, keys = translate_update_fields(self.__class__, update_fields)
+        elif (
+            self._meta.get_field("i18n").skip_unchanged
+            and not adding
+            and not kwargs.get("force_insert")
+            and "i18n" in self.__dict__
+            and not i18n_has_changed(self)
+        ):
+            # leave i18n out of the UPDATE, like Django does for deferred fields.
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not getattr(field, "generated", False)
+                and field.attname in self.__dict__
+                and field.name != "i18n"
+            ]
+
+        if keys is None:
+            old_save(self, *args, update_fields=update_fields, **kwargs)
+        else:
+            self.__dict__[I18N_UPDATE_KEYS_ATTNAME] = keys
+            try:
+                old_save(self, *args, update_fields=update_fields, **kwargs)
+            finally:
+                del self.__dict__[I18N_UPDATE_KEYS_ATTNAME]
+
+        dirty_keys = self.__dict__.get(I18N_DIRTY_KEYS_ATTNAME)
+        if update_fields is None or keys is None and "i18n" in update_fields:
+            written_keys = None
+            if (
+                not adding
+                and dirty_keys is not None
+                and self._meta.get_field("i18n").partial_updates
+            ):
+                written_keys = dirty_keys
+            self.__dict__[I18N_DIRTY_KEYS_ATTNAME] = set()
+            take_i18n_snapshot(self, written_keys)
+        elif keys is not None:
+            if dirty_keys is not None:
+                dirty_keys.difference_update(keys)
+            take_i18n_snapshot(self, keys)
+
+    patched_save.patched_by_modeltrans = True
+    model.save = patched_save
+
+
+def add_change_tracking_methods(Model):
+    """
+    Add `i18n_has_changed()` and `changed_translation_keys()` to models with `skip_unchanged`
+    enabled, comparing the i18n field to the value loaded from (or last saved to) the database.
+    """
+    Model.i18n_has_changed = i18n_has_changed
+    Model.changed_translation_keys = changed_translation_keys
+
+
 def translate_meta_ordering(Model):
     """
     If a model has ``Meta.ordering`` defined, we check if
@@ -1,11 +1,12 @@
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Expression, Func, JSONField, TextField, Value
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.json import KeyTransform
 from django.db.models.lookups import Transform
 from django.utils.functional import keep_lazy_text
-from django.utils.translation import get_language as _get_language
+from django.utils.translation import get_language as _get_language, override
 
-from .conf import get_available_languages, get_default_language
+from .conf import get_default_language, get_language_config
 
 
 def get_language():
@@ -14,10 +15,11 @@ def get_language():
 
     (Django does not seem to guarantee this for us.)
     """
+    config = get_language_config()
     lang = _get_language()
-    if lang in get_available_languages():
+    if lang in config.available_languages:
         return lang
-    return get_default_language()
+    return config.default_language
 
 
 def split_translated_fieldname(field_name):
@@ -40,6 +42,13 @@ def build_localized_fieldname(field_name, lang, ignore_default=False):
     return "{}_{}".format(field_name, lang.replace("-", "_"))
 
 
+def build_generated_fieldname(field_name, lang):
+    """
+    Return the name of the generated column for `lang` added for ``TranslationField(generated_languages=...)``.
+    """
+    return "{}_gen".format(build_localized_fieldname(field_name, lang))
+
+
 def get_model_field(model, path):
     """
     Return the django model field for model in context, following relations.
@@ -90,6 +99,15 @@ class FallbackTransform(Transform):
         self.field_prefix = field_prefix
         self.language_expression = language_expression
 
+    def resolve_expression(self, query=None, *args, **kwargs):
+        # Resolve the language expression together with the rest of the expression, to make
+        # sure the joins it needs are set up before the query is compiled.
+        clone = super().resolve_expression(query, *args, **kwargs)
+        clone.language_expression = self.language_expression.resolve_expression(
+            query, *args, **kwargs
+        )
+        return clone
+
     def preprocess_lhs(self, compiler, connection, lhs_only=False):
         if not lhs_only:
             key_transforms = [self.field_prefix]
@@ -105,8 +123,204 @@ class FallbackTransform(Transform):
         lhs, params, key_transforms = self.preprocess_lhs(compiler, connection)
         params = tuple(params) + (self.field_prefix,)
 
-        rhs = self.language_expression.resolve_expression(compiler.query)
-        rhs_sql, rhs_params = compiler.compile(rhs)
+        rhs_sql, rhs_params = compiler.compile(self.language_expression)
         params = params + tuple(rhs_params)
 
         return ("({} ->> (%s || {} ))".format(lhs, rhs_sql), params)
+
+
+class JSONBRemoveKeys(Func):
+    """
+    Remove a list of keys from a jsonb value.
+
+    For example: `JSONBRemoveKeys("i18n", ["title_de", "title_fr"])` becomes in SQL:
+        `("i18n" - '{title_de,title_fr}'::text[])`
+    """
+
+    template = "(%(expressions)s::text[])"
+    arg_joiner = " - "
+
+    def __init__(self, expression, keys, **extra):
+        extra.setdefault("output_field", JSONField())
+        super().__init__(expression, Value(list(keys)), **extra)
+
+
+class JSONBConcat(Func):
+    """
+    Concatenate jsonb values, keys in the rightmost value take precedence.
+
+    For example: `JSONBConcat("i18n", Value({"title_nl": "Valk"}, output_field=JSONField()))`
+    becomes in SQL: `("i18n" || '{"title_nl": "Valk"}')`
+    """
+
+    template = "(%(expressions)s)"
+    arg_joiner = " || "
+
+    def __init__(self, *expressions, **extra):
+        extra.setdefault("output_field", JSONField())
+        super().__init__(*expressions, **extra)
+
+
+# Name of the SQL function installed by `modeltrans.operations.CreateFallbackFunction`, and the
+# maximum number of keys it looks up.
+FALLBACK_FUNCTION = "modeltrans_get"
+FALLBACK_FUNCTION_MAX_KEYS = 10
+
+
+class FallbackFunction(Func):
+    """
+    Call the SQL function returning the first value found for a list of keys in a jsonb value.
+
+    An empty key refers to the value of the original field (for the default language), a
+    `NULL` key is skipped. At most `FALLBACK_FUNCTION_MAX_KEYS` keys can be passed.
+
+    For example: `FallbackFunction("i18n", [Value("title_nl"), Value("")], "title")`
+    becomes in SQL:
+        `modeltrans_get("i18n", ARRAY['title_nl', '']::text[], "title")`
+    """
+
+    function = FALLBACK_FUNCTION
+
+    def __init__(self, expression, keys, original, **extra):
+        if len(keys) > FALLBACK_FUNCTION_MAX_KEYS:
+            raise ValueError(
+                "{} accepts at most {} keys.".format(FALLBACK_FUNCTION, FALLBACK_FUNCTION_MAX_KEYS)
+            )
+        keys = Func(*keys, template="ARRAY[%(expressions)s]::text[]", output_field=TextField())
+        super().__init__(expression, keys, original, **extra)
+
+
+class ResolvedColumns:
+    """
+    Stand-in for a query to resolve expressions against, resolving each referenced name once
+    using `query` and reusing the result for later references to the same name.
+
+    Arguments:
+        query: the query to resolve names not in `columns` with.
+        columns (dict): names mapped to their resolved expressions.
+    """
+
+    def __init__(self, query, columns):
+        self.query = query
+        self.columns = columns
+
+    def __getattr__(self, name):
+        return getattr(self.query, name)
+
+    def resolve_ref(self, name, *args, **kwargs):
+        if name not in self.columns:
+            self.columns[name] = self.query.resolve_ref(name, *args, **kwargs)
+        return self.columns[name]
+
+
+class ActiveLanguageExpression(Expression):
+    """
+    Expression for a ``<field>_i18n`` virtual field, composed for the language active when the
+    query is compiled rather than when the queryset is built.
+
+    When resolved, the columns referenced by the expression for any available language are
+    resolved, so the joins they need are set up before the query is compiled. Languages only
+    differ in the keys looked up in `i18n`, apart from generated columns, so this resolves the
+    expressions for the default language, the languages with a generated column and one other
+    language. Compiling composes the expression for the active language using those columns.
+
+    Arguments:
+        virtual_field (TranslatedVirtualField): the virtual field following the active language.
+        bare_lookup (str): the lookup for the virtual field, for example `category__name_i18n`.
+        fallback (bool): passed to `TranslatedVirtualField.as_expression()`.
+    """
+
+    def __init__(self, virtual_field, bare_lookup, fallback=True):
+        super().__init__(output_field=virtual_field.output_field())
+        self.virtual_field = virtual_field
+        self.bare_lookup = bare_lookup
+        self.fallback = fallback
+
+        # names referenced by the expression and their resolved columns, set by
+        # `resolve_expression()`.
+        self.names = ()
+        self.columns = []
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self.bare_lookup)
+
+    def get_expression(self):
+        return self.virtual_field.as_expression(
+            bare_lookup=self.bare_lookup, fallback=self.fallback
+        )
+
+    def get_resolved_languages(self):
+        """
+        Return the languages for which the expressions together reference all names the
+        expression for any language can reference.
+        """
+        config = get_language_config()
+        generated_languages = self.virtual_field.model._meta.get_field("i18n").generated_languages
+
+        languages = [config.default_language]
+        languages.extend(
+            language for language in config.translation_languages if language in generated_languages
+        )
+        languages.extend(
+            [
+                language
+                for language in config.translation_languages
+                if language not in generated_languages
+            ][:1]
+        )
+        return languages
+
+    def get_source_expressions(self):
+        return list(self.columns)
+
+    def set_source_expressions(self, exprs):
+        self.columns = list(exprs)
+
+    def deconstruct(self):
+        # Used by migrations (for example for Meta.ordering), which are not tied to an active
+        # language, so describe the expression for the default language.
+        with override(get_default_language()):
+            return self.get_expression().deconstruct()
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        if self.names:
+            # already resolved, for example in a subquery resolved against the outer query.
+            return super().resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+        columns = ResolvedColumns(query, {})
+        for language in self.get_resolved_languages():
+            with override(language):
+                self.get_expression().resolve_expression(
+                    columns, allow_joins, reuse, summarize, for_save
+                )
+
+        clone = self.copy()
+        clone.names = tuple(columns.columns)
+        clone.columns = list(columns.columns.values())
+        return clone
+
+    def as_sql(self, compiler, connection):
+        if not self.names:
+            raise ValueError("{!r} must be resolved before it is compiled.".format(self))
+        columns = ResolvedColumns(compiler.query, dict(zip(self.names, self.columns)))
+        return compiler.compile(self.get_expression().resolve_expression(columns))
+
+
+class JSONBBuildObject(Func):
+    """
+    Build a jsonb object from a dict of keys to expressions.
+
+    For example: `JSONBBuildObject({"title_nl": F("title")})` becomes in SQL:
+        `jsonb_build_object('title_nl', "title")`
+    """
+
+    function = "jsonb_build_object"
+
+    def __init__(self, values, **extra):
+        extra.setdefault("output_field", JSONField())
+        expressions = []
+        for key, value in values.items():
+            expressions.extend((Value(key, output_field=TextField()), value))
+        super().__init__(*expressions, **extra)
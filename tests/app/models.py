@@ -208,6 +208,18 @@ class ChallengeContent(models.Model):
         return self.content_i18n
 
 
+class Species(models.Model):
+    """Model caching the resolved `<field>_i18n` values on the instance."""
+
+    name = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+
+    i18n = TranslationField(fields=("name", "description"), cache_translations=True)
+
+    def __str__(self):
+        return self.name_i18n
+
+
 class Post(models.Model):
     title = models.CharField(
         verbose_name=gettext_lazy("title of the post"),
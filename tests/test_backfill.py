@@ -0,0 +1,151 @@
+from io import StringIO
+
+from django.db import models
+from django.test import TestCase, TransactionTestCase
+
+from modeltrans.backfill import (
+    backfill_model,
+    create_checkpoint_table,
+    delete_checkpoints,
+    get_checkpoint,
+    get_pk_ranges,
+    run_backfill,
+    save_checkpoint,
+)
+from modeltrans.fields import TranslationField
+
+from .utils import CreateTestModel
+
+
+class BackfillModel(models.Model):
+    title = models.CharField(max_length=255)
+    title_en = models.CharField(max_length=255, null=True)
+    title_nl = models.CharField(max_length=255, null=True)
+
+    i18n = TranslationField(fields=("title",), virtual_fields=False)
+
+    class Meta:
+        app_label = "tests"
+
+
+FIELDS = ("title_en", "title_nl")
+
+
+class BackfillTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_model = CreateTestModel(BackfillModel)
+        cls.test_model.__enter__()
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.test_model.__exit__()
+
+    def setUp(self):
+        create_checkpoint_table()
+        self.instances = BackfillModel.objects.bulk_create(
+            [
+                BackfillModel(title="", title_en="Falcon", title_nl="Valk"),
+                BackfillModel(title="", title_en="Frog", title_nl="Kikker"),
+                BackfillModel(title="", title_en="Fox", title_nl=""),
+            ]
+        )
+
+    def values(self):
+        return [(m.title, m.i18n) for m in BackfillModel.objects.order_by("pk")]
+
+    def test_backfill(self):
+        stdout = StringIO()
+        self.assertEqual(backfill_model(BackfillModel, FIELDS, batch_size=2, stdout=stdout), 3)
+
+        self.assertEqual(
+            self.values(),
+            [("Falcon", {"title_nl": "Valk"}), ("Frog", {"title_nl": "Kikker"}), ("Fox", {})],
+        )
+        self.assertEqual(
+            get_checkpoint("tests.BackfillModel"), (str(self.instances[-1].pk), 3, True)
+        )
+        self.assertIn("tests.BackfillModel: 2 rows copied", stdout.getvalue())
+        self.assertIn("tests.BackfillModel: completed (3 rows)", stdout.getvalue())
+
+    def test_resume(self):
+        save_checkpoint("tests.BackfillModel", self.instances[0].pk, 1)
+
+        self.assertEqual(backfill_model(BackfillModel, FIELDS, batch_size=2), 3)
+        self.assertEqual(
+            self.values(),
+            [("", None), ("Frog", {"title_nl": "Kikker"}), ("Fox", {})],
+        )
+
+    def test_completed(self):
+        save_checkpoint("tests.BackfillModel", self.instances[-1].pk, 3, completed=True)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(backfill_model(BackfillModel, FIELDS), 3)
+
+        save_checkpoint("tests.BackfillModel[0:10]", None, 0)
+        delete_checkpoints([BackfillModel])
+        self.assertIsNone(get_checkpoint("tests.BackfillModel"))
+        self.assertIsNone(get_checkpoint("tests.BackfillModel[0:10]"))
+
+    def test_pk_ranges(self):
+        pks = [instance.pk for instance in self.instances]
+        self.assertEqual(
+            get_pk_ranges(BackfillModel, 2),
+            sorted({(pk // 2 * 2, pk // 2 * 2 + 2) for pk in pks}),
+        )
+
+        # ranges without rows are skipped.
+        BackfillModel.objects.create(title="", pk=pks[-1] + 100)
+        self.assertEqual(get_pk_ranges(BackfillModel, 100)[-1][0], (pks[-1] + 100) // 100 * 100)
+        self.assertEqual(len(get_pk_ranges(BackfillModel, 1)), 4)
+
+        BackfillModel.objects.all().delete()
+        self.assertEqual(get_pk_ranges(BackfillModel, 2), [None])
+
+    def test_run_backfill_ranges(self):
+        stdout = StringIO()
+        results = run_backfill([(BackfillModel, FIELDS)], batch_size=1, range_size=2, stdout=stdout)
+        self.assertIn("completed", stdout.getvalue())
+
+        self.assertEqual(sum(rows for label, pk_range, rows, seconds in results), 3)
+        self.assertEqual(len(results), len(get_pk_ranges(BackfillModel, 2)))
+        self.assertEqual(
+            self.values(),
+            [("Falcon", {"title_nl": "Valk"}), ("Frog", {"title_nl": "Kikker"}), ("Fox", {})],
+        )
+
+        pk_range = results[0][1]
+        self.assertEqual(get_checkpoint("tests.BackfillModel[{}:{}]".format(*pk_range))[2], True)
+
+
+class WorkersTest(TransactionTestCase):
+    def setUp(self):
+        self.test_model = CreateTestModel(BackfillModel)
+        self.test_model.__enter__()
+        create_checkpoint_table()
+
+        BackfillModel.objects.bulk_create(
+            [
+                BackfillModel(title="", title_en="Falcon", title_nl="Valk"),
+                BackfillModel(title="", title_en="Frog", title_nl="Kikker"),
+                BackfillModel(title="", title_en="Fox", title_nl=""),
+            ]
+        )
+
+    def tearDown(self):
+        delete_checkpoints([BackfillModel])
+        self.test_model.__exit__()
+
+    def test_run_backfill_workers(self):
+        results = run_backfill([(BackfillModel, FIELDS)], batch_size=1, range_size=1, workers=2)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(rows for label, pk_range, rows, seconds in results), 3)
+        self.assertEqual(
+            [(m.title, m.i18n) for m in BackfillModel.objects.order_by("pk")],
+            [("Falcon", {"title_nl": "Valk"}), ("Frog", {"title_nl": "Kikker"}), ("Fox", {})],
+        )
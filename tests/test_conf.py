@@ -1,7 +1,13 @@
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase, override_settings
 
-from modeltrans.conf import check_fallback_chain, get_available_languages_setting
+from modeltrans.conf import (
+    check_fallback_chain,
+    get_available_languages,
+    get_available_languages_setting,
+    get_fallback_chain,
+    get_language_config,
+)
 from modeltrans.translator import check_languages, get_i18n_field, get_i18n_field_param
 
 from .app.models import Person
@@ -60,3 +66,34 @@ class DefaultLanguageConfTest(TestCase):
         i18n_field = get_i18n_field(Person)
         required_languages = get_i18n_field_param(Person, i18n_field, "required_languages")
         check_languages(required_languages, Person)
+
+
+class LanguageConfigTest(TestCase):
+    def test_config_is_reused(self):
+        self.assertIs(get_language_config(), get_language_config())
+
+    def test_config_values(self):
+        config = get_language_config()
+
+        self.assertEqual(config.default_language, "en")
+        self.assertEqual(config.available_languages, frozenset(("en", "nl", "de", "fr")))
+        self.assertEqual(set(config.translation_languages), {"nl", "de", "fr"})
+        self.assertEqual(set(get_available_languages()), config.available_languages)
+
+    @override_settings(
+        MODELTRANS_AVAILABLE_LANGUAGES=("fy", "nl"),
+        MODELTRANS_FALLBACK={"default": ("en",), "fy": ("nl", "en", "nl")},
+    )
+    def test_config_rebuilt_on_setting_changed(self):
+        config = get_language_config()
+
+        self.assertEqual(config.available_languages, frozenset(("en", "fy", "nl")))
+        self.assertEqual(get_fallback_chain("fy"), ("nl", "en"))
+        self.assertEqual(get_fallback_chain("nl"), ("en",))
+
+    def test_config_rebuilt_after_override(self):
+        config = get_language_config()
+        with override_settings(MODELTRANS_DEFAULT_LANGUAGE="nl"):
+            self.assertEqual(get_language_config().default_language, "nl")
+
+        self.assertEqual(get_language_config(), config)
@@ -0,0 +1,94 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, models
+from django.test import TestCase
+from django.utils.translation import override
+
+from modeltrans.fields import TranslationField
+from modeltrans.indexes import TranslatedGinIndex, TranslatedIndex
+
+from .app.models import Blog, Challenge
+from .utils import CreateTestModel
+
+
+def create_sql(index, model):
+    with connection.schema_editor() as editor:
+        return str(index.create_sql(model, editor))
+
+
+class TranslatedIndexTest(TestCase):
+    def test_deconstruct(self):
+        index = TranslatedIndex("title_i18n", language="nl", name="blog_title_nl")
+
+        path, args, kwargs = index.deconstruct()
+        self.assertEqual(path, "modeltrans.indexes.TranslatedIndex")
+        self.assertEqual(args, ("title_i18n",))
+        self.assertEqual(kwargs, {"language": "nl", "name": "blog_title_nl"})
+
+        self.assertEqual(TranslatedIndex(*args, **kwargs), index)
+
+    def test_deconstruct_opclasses(self):
+        index = TranslatedGinIndex("title_nl", opclasses=["gin_trgm_ops"], name="blog_title_trgm")
+
+        path, args, kwargs = index.deconstruct()
+        self.assertEqual(path, "modeltrans.indexes.TranslatedGinIndex")
+        self.assertEqual(args, ("title_nl",))
+        self.assertEqual(kwargs, {"opclasses": ("gin_trgm_ops",), "name": "blog_title_trgm"})
+
+    def test_i18n_requires_language(self):
+        with self.assertRaisesMessage(ValueError, 'TranslatedIndex on "title_i18n" requires a'):
+            TranslatedIndex("title_i18n", name="blog_title")
+
+    def test_unknown_field(self):
+        index = TranslatedIndex("foo_nl", name="blog_foo_nl")
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "not a translated field of"):
+            create_sql(index, Blog)
+
+    def test_explicit_language_sql(self):
+        sql = create_sql(TranslatedIndex("title_nl", name="blog_title_nl"), Blog)
+
+        self.assertIn("""("i18n" ->> 'title_nl')""", sql)
+        self.assertNotIn("COALESCE", sql)
+
+    def test_fallback_sql(self):
+        sql = create_sql(TranslatedIndex("title_i18n", language="nl", name="blog_title"), Blog)
+
+        self.assertIn("COALESCE", sql)
+        self.assertIn("""("i18n" ->> 'title_nl')""", sql)
+        self.assertIn('"title"', sql)
+
+    def test_fallback_language_field_sql(self):
+        index = TranslatedIndex("title_i18n", language="nl", name="challenge_title")
+
+        self.assertIn('"default_language"', create_sql(index, Challenge))
+
+    def test_gin_opclass_sql(self):
+        index = TranslatedGinIndex("title_nl", opclasses=["gin_trgm_ops"], name="blog_title_trgm")
+        sql = create_sql(index, Blog)
+
+        self.assertIn("USING gin", sql)
+        self.assertIn("gin_trgm_ops", sql)
+
+    def test_index_used_for_ordering(self):
+        class IndexedModel(models.Model):
+            title = models.CharField(max_length=100)
+            i18n = TranslationField(fields=("title",))
+
+            class Meta:
+                app_label = "test"
+                indexes = [TranslatedIndex("title_i18n", language="nl", name="indexed_title_nl")]
+
+        with CreateTestModel(IndexedModel, translate=True):
+            self.assertIn(
+                "indexed_title_nl",
+                connection.introspection.get_constraints(
+                    connection.cursor(), IndexedModel._meta.db_table
+                ),
+            )
+
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                with override("nl"):
+                    plan = IndexedModel.objects.order_by("title_i18n").explain()
+
+            self.assertIn("indexed_title_nl", plan)
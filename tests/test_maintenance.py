@@ -0,0 +1,179 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from modeltrans.maintenance import (
+    drop_language,
+    get_translated_tables,
+    rename_language,
+    update_in_batches,
+)
+from modeltrans.utils import JSONBRemoveKeys
+
+from .app.models import Article, Blog, Category, Challenge, ChildArticle, TaggedBlog
+
+
+class GetTranslatedTablesTest(TestCase):
+    def test_tables(self):
+        models = [Model for Model, i18n_field in get_translated_tables()]
+
+        self.assertIn(Blog, models)
+        self.assertIn(Article, models)
+        # uses the i18n field of Article.
+        self.assertNotIn(ChildArticle, models)
+
+
+class UpdateInBatchesTest(TestCase):
+    def test_update_in_batches(self):
+        for title in ("Falcon", "Frog", "Fox"):
+            Blog.objects.create(title=title, i18n={"title_fr": title, "title_nl": title})
+
+        stdout = StringIO()
+        rows = update_in_batches(
+            Blog.objects.all(),
+            {"i18n": JSONBRemoveKeys("i18n", ["title_fr"])},
+            batch_size=2,
+            stdout=stdout,
+        )
+
+        self.assertEqual(rows, 3)
+        self.assertEqual(stdout.getvalue(), "app.Blog: 2 rows updated\napp.Blog: 3 rows updated\n")
+        self.assertEqual(
+            list(Blog.objects.order_by("pk").values_list("i18n", flat=True)),
+            [{"title_nl": "Falcon"}, {"title_nl": "Frog"}, {"title_nl": "Fox"}],
+        )
+
+
+class DropLanguageTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.blog = Blog.objects.create(
+            title="Falcon", i18n={"title_nl": "Valk", "title_fr": "Faucon", "body_fr": "Oiseau"}
+        )
+        cls.category = Category.objects.create(name="Birds", i18n={"name_fr": "Oiseaux"})
+        Blog.objects.create(title="Frog", i18n={"title_nl": "Kikker"})
+
+    def test_drop_language(self):
+        results = drop_language("fr", batch_size=1)
+
+        self.assertEqual(results["app.Blog"], (1, None))
+        self.assertEqual(results["app.Category"], (1, None))
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.i18n, {"title_nl": "Valk"})
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.i18n, {})
+
+    def test_dry_run(self):
+        results = drop_language("fr", dry_run=True)
+
+        rows, size = results["app.Blog"]
+        self.assertEqual(rows, 1)
+        self.assertGreater(size, 0)
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.title_fr, "Faucon")
+
+    def test_default_language(self):
+        with self.assertRaises(ValueError):
+            drop_language("en")
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("i18n_drop_language", "fr", "--dry-run", stdout=stdout)
+        self.assertIn("app.Blog: 1 rows", stdout.getvalue())
+        self.assertIn("Would remove translations from 2 rows", stdout.getvalue())
+
+        stdout = StringIO()
+        call_command("i18n_drop_language", "fr", stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "Removed translations from 2 rows\n")
+
+        with self.assertRaises(CommandError):
+            call_command("i18n_drop_language", "en")
+
+
+class RenameLanguageTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.falcon = Blog.objects.create(
+            title="Falcon", i18n={"title_zh": "Hayabusa", "body_zh": "Niao"}
+        )
+        cls.frog = Blog.objects.create(
+            title="Frog", i18n={"title_zh": "Qingwa", "title_zh_hans": "Wa", "title_nl": "Kikker"}
+        )
+        cls.fox = Blog.objects.create(title="Fox", i18n={"title_nl": "Vos"})
+        cls.tagged = TaggedBlog.objects.create(
+            title="Falcon", i18n={"tags_zh": [{"name": "niao", "parent": None}]}
+        )
+
+    def assertI18n(self, instance, expected):
+        instance.refresh_from_db()
+        self.assertEqual(instance.i18n, expected)
+
+    def test_keep(self):
+        results = rename_language("zh", "zh-hans", conflict="keep", batch_size=1)
+
+        self.assertEqual(results["app.Blog"], 2)
+        self.assertI18n(self.falcon, {"title_zh_hans": "Hayabusa", "body_zh_hans": "Niao"})
+        self.assertI18n(self.frog, {"title_zh_hans": "Wa", "title_nl": "Kikker"})
+        self.assertI18n(self.fox, {"title_nl": "Vos"})
+        self.assertI18n(self.tagged, {"tags_zh_hans": [{"name": "niao", "parent": None}]})
+
+    def test_overwrite(self):
+        rename_language("zh", "zh-hans", conflict="overwrite")
+
+        self.assertI18n(self.falcon, {"title_zh_hans": "Hayabusa", "body_zh_hans": "Niao"})
+        self.assertI18n(self.frog, {"title_zh_hans": "Qingwa", "title_nl": "Kikker"})
+
+    def test_error(self):
+        with self.assertRaisesMessage(ValueError, '1 rows of "app.Blog" have translations'):
+            rename_language("zh", "zh-hans")
+
+        self.assertI18n(self.falcon, {"title_zh": "Hayabusa", "body_zh": "Niao"})
+
+    def test_error_concurrent_conflict(self):
+        # a conflicting translation written after checking for conflicts.
+        with mock.patch.object(QuerySet, "count", return_value=0):
+            results = rename_language("zh", "zh-hans")
+
+        self.assertEqual(results["app.Blog"], 1)
+        self.assertI18n(self.falcon, {"title_zh_hans": "Hayabusa", "body_zh_hans": "Niao"})
+        self.assertI18n(
+            self.frog, {"title_zh": "Qingwa", "title_zh_hans": "Wa", "title_nl": "Kikker"}
+        )
+
+    def test_fallback_language_field(self):
+        fallback = Challenge.objects.create(title="Falcon", default_language="zh")
+        translated = Challenge.objects.create(
+            title="Frog", default_language="nl", i18n={"title_zh": "Qingwa"}
+        )
+
+        results = rename_language("zh", "cn", conflict="keep")
+
+        self.assertEqual(results["app.Challenge"], 2)
+        fallback.refresh_from_db()
+        self.assertEqual(fallback.default_language, "cn")
+        translated.refresh_from_db()
+        self.assertEqual(translated.default_language, "nl")
+        self.assertEqual(translated.i18n, {"title_cn": "Qingwa"})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rename_language("zh", "zh-hans", conflict="ignore")
+        with self.assertRaises(ValueError):
+            rename_language("en", "nl")
+        with self.assertRaises(ValueError):
+            # both use keys like title_ind
+            rename_language("id", "ind")
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("i18n_rename_language", "zh", "zh-hans", "--conflict=keep", stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "Renamed translations in 3 rows\n")
+
+        with self.assertRaises(CommandError):
+            call_command("i18n_rename_language", "en", "nl")
@@ -1,11 +1,18 @@
 from io import StringIO
+from unittest import mock
 
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
+from django.db.migrations.graph import MigrationGraph
 from django.test import TestCase
 
 from modeltrans.fields import TranslationField
-from modeltrans.migration import I18nDataMigration, copy_translations, get_translatable_models
+from modeltrans.migration import (
+    I18nDataMigration,
+    copy_translations,
+    get_latest_migration,
+    get_translatable_models,
+)
 
 from .app.models import Blog, Category
 from .utils import CreateTestModel
@@ -28,6 +35,14 @@ class I18nMigrationsTest(TestCase):
         self.assertTrue("title_nl" in output)
         self.assertTrue("title_fr" in output)
         self.assertTrue("migrations.RunPython(forwards, migrations.RunPython.noop)" in output)
+        self.assertTrue("atomic = False" in output)
+        self.assertTrue("batch_size=10000" in output)
+
+    def test_I18nDataMigration_batch_size(self):
+        m = I18nDataMigration("test_app", batch_size=500)
+        m.add_model(Blog, ("title_nl", "title_fr"))
+
+        self.assertTrue("batch_size=500" in get_output(m))
 
     def test_get_translatable_models(self):
         """
@@ -75,3 +90,109 @@ class I18nMigrationsTest(TestCase):
             copy_translations(TestModel, ("title_en", "title_nl", "title_de"))
             m.refresh_from_db()
             self.assertEqual(m.i18n, {"title_nl": "Valk"})
+
+    def test_copy_translations_batches(self):
+        class BatchTestModel(models.Model):
+            title = models.CharField(max_length=255)
+            title_en = models.CharField(max_length=255, null=True)
+            title_nl = models.CharField(max_length=255, null=True)
+            title_de = models.CharField(max_length=255, null=True)
+
+            i18n = TranslationField(fields=("title",), virtual_fields=False)
+
+            class Meta:
+                app_label = "tests"
+
+        with CreateTestModel(BatchTestModel):
+            BatchTestModel.objects.bulk_create(
+                [
+                    BatchTestModel(title="", title_en="Falcon", title_nl="Valk", title_de="Falke"),
+                    BatchTestModel(title="Frog", title_en="", title_nl="Kikker"),
+                    BatchTestModel(title="Gecko", title_en=None, title_de=""),
+                    BatchTestModel(title="", title_en="Fox", title_nl="Vos"),
+                    BatchTestModel(title="", title_en="Vulture", title_de="Geier"),
+                ]
+            )
+
+            with self.assertNumQueries(6):
+                copy_translations(
+                    BatchTestModel, ("title_en", "title_nl", "title_de"), batch_size=2
+                )
+
+            self.assertEqual(
+                [(m.title, m.i18n) for m in BatchTestModel.objects.order_by("pk")],
+                [
+                    ("Falcon", {"title_nl": "Valk", "title_de": "Falke"}),
+                    ("Frog", {"title_nl": "Kikker"}),
+                    ("Gecko", {}),
+                    ("Fox", {"title_nl": "Vos"}),
+                    ("Vulture", {"title_de": "Geier"}),
+                ],
+            )
+
+    def test_copy_translations_json(self):
+        class JSONTestModel(models.Model):
+            tags = models.JSONField(null=True)
+            tags_en = models.JSONField(null=True)
+            tags_nl = models.JSONField(null=True)
+            tags_de = models.JSONField(null=True)
+
+            i18n = TranslationField(fields=("tags",), virtual_fields=False)
+
+            class Meta:
+                app_label = "tests"
+
+        with CreateTestModel(JSONTestModel):
+            m = JSONTestModel.objects.create(
+                tags_en=[{"name": "bird", "parent": None}],
+                tags_nl=[{"name": "vogel", "parent": None}],
+                tags_de=None,
+            )
+
+            copy_translations(JSONTestModel, ("tags_en", "tags_nl", "tags_de"))
+
+            m.refresh_from_db()
+            self.assertEqual(m.tags, [{"name": "bird", "parent": None}])
+            # only top-level null values are left out.
+            self.assertEqual(m.i18n, {"tags_nl": [{"name": "vogel", "parent": None}]})
+
+
+class MigrationLoaderTest(TestCase):
+    def get_loader(self, app_labels, count):
+        """
+        Return a loader with a graph of `count` applied migrations for each app in `app_labels`.
+        """
+        graph = MigrationGraph()
+        applied_migrations = {}
+        for app_label in app_labels:
+            previous = None
+            for i in range(1, count + 1):
+                key = (app_label, "{:04d}_auto".format(i))
+                graph.add_node(key, None)
+                if previous is not None:
+                    graph.add_dependency(None, key, previous, skip_validation=True)
+                applied_migrations[key] = None
+                previous = key
+        graph.validate_consistency()
+
+        return mock.Mock(graph=graph, applied_migrations=applied_migrations)
+
+    def test_shared_loader(self):
+        app_labels = ["app_{}".format(i) for i in range(3)]
+        loader = self.get_loader(app_labels, 10)
+
+        with mock.patch("modeltrans.migration.MigrationLoader") as MigrationLoader:
+            for app_label in app_labels:
+                self.assertEqual(get_latest_migration(app_label, loader=loader), "0010_auto")
+                m = I18nDataMigration(app_label, loader=loader)
+                self.assertEqual(m.migration_filename, "0010_auto")
+
+        MigrationLoader.assert_not_called()
+
+    def test_default_loader(self):
+        with mock.patch("modeltrans.migration.MigrationLoader") as MigrationLoader:
+            MigrationLoader.return_value = self.get_loader(["test_app"], 2)
+            m = I18nDataMigration("test_app")
+
+        MigrationLoader.assert_called_once()
+        self.assertEqual(m.migration_filename, "0002_auto")
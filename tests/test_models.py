@@ -1,6 +1,9 @@
+from unittest import mock
+
 from django.core.exceptions import ValidationError
-from django.db import DataError, models, transaction
+from django.db import DataError, connection, models, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import override
 
 from modeltrans.fields import TranslationField
@@ -12,6 +15,7 @@ from .app.models import (
     ChallengeContent,
     ChildArticle,
     NullableTextModel,
+    Species,
     TaggedBlog,
     TextModel,
 )
@@ -282,6 +286,132 @@ class TranslatedFieldTest(TestCase):
         with self.assertRaises(ValueError):
             blog.title_i18n
 
+    def test_get_does_not_call_get_deferred_fields(self):
+        """
+        Checking for a deferred i18n field should not depend on the number of fields of the model.
+        """
+        blog = Blog.objects.create(title="Buzzard", title_nl="Buizerd")
+        blog = Blog.objects.get(pk=blog.pk)
+
+        with mock.patch.object(Blog, "get_deferred_fields") as get_deferred_fields:
+            with override("nl"):
+                self.assertEqual(blog.title_i18n, "Buizerd")
+            self.assertEqual(blog.title_nl, "Buizerd")
+
+        get_deferred_fields.assert_not_called()
+
+
+class TranslationCacheTest(TestCase):
+    def test_cache_disabled_by_default(self):
+        m = Blog(title="Falcon", i18n={"title_nl": "Valk"})
+
+        with override("nl"):
+            self.assertEqual(m.title_i18n, "Valk")
+        self.assertNotIn("_i18n_cache", m.__dict__)
+
+    def test_cached_value(self):
+        m = Species(name="Falcon", i18n={"name_nl": "Valk"})
+
+        with override("nl"):
+            self.assertEqual(m.name_i18n, "Valk")
+            with mock.patch.object(
+                Species._meta.get_field("name_i18n"), "get_instance_fallback_chain"
+            ) as get_instance_fallback_chain, mock.patch.object(
+                Species._meta, "get_field"
+            ) as get_field:
+                self.assertEqual(m.name_i18n, "Valk")
+
+            get_instance_fallback_chain.assert_not_called()
+            get_field.assert_not_called()
+
+        with override("fr"):
+            self.assertEqual(m.name_i18n, "Falcon")
+
+    def test_cache_invalidated_by_set(self):
+        m = Species(name="Falcon", i18n={"name_de": "Falk"})
+
+        with override("nl"):
+            self.assertEqual(m.name_i18n, "Falcon")
+            m.name_nl = "Valk"
+            self.assertEqual(m.name_i18n, "Valk")
+
+            m.name_i18n = "Slechtvalk"
+            self.assertEqual(m.name_i18n, "Slechtvalk")
+
+    def test_cache_invalidated_by_assigning_i18n(self):
+        m = Species(name="Falcon", i18n={"name_nl": "Valk"})
+
+        with override("nl"):
+            self.assertEqual(m.name_i18n, "Valk")
+            m.i18n = {"name_nl": "Slechtvalk"}
+            self.assertEqual(m.name_i18n, "Slechtvalk")
+
+    def test_cache_invalidated_by_assigning_original_field(self):
+        m = Species(name="Falcon")
+
+        with override("nl"):
+            self.assertEqual(m.name_i18n, "Falcon")
+            m.name = "Peregrine falcon"
+            self.assertEqual(m.name_i18n, "Peregrine falcon")
+
+    def test_cache_invalidated_by_refresh_from_db(self):
+        m = Species.objects.create(name="Falcon", name_nl="Valk")
+        Species.objects.filter(pk=m.pk).update(i18n={"name_nl": "Slechtvalk"})
+
+        with override("nl"):
+            self.assertEqual(m.name_i18n, "Valk")
+            m.refresh_from_db()
+            self.assertEqual(m.name_i18n, "Slechtvalk")
+
+    def test_defer_i18n(self):
+        Species.objects.create(name="Falcon", name_nl="Valk")
+        m = Species.objects.defer("i18n").get()
+
+        with override("nl"):
+            with self.assertRaises(ValueError):
+                m.name_i18n
+
+
+class ExpressionCacheTest(TestCase):
+    def test_expression_is_cached(self):
+        field = Blog._meta.get_field("title_i18n")
+
+        with override("nl"):
+            first = field.as_expression(bare_lookup="title_i18n")
+            with mock.patch.object(field, "_compose_expression") as compose:
+                second = field.as_expression(bare_lookup="title_i18n")
+            compose.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_cache_key(self):
+        field = Blog._meta.get_field("title_i18n")
+
+        with override("nl"):
+            nl = field.as_expression(bare_lookup="title_i18n")
+            nl_no_fallback = field.as_expression(bare_lookup="title_i18n", fallback=False)
+            related = field.as_expression(bare_lookup="blog__title_i18n")
+        with override("de"):
+            de = field.as_expression(bare_lookup="title_i18n")
+
+        self.assertEqual(len({nl, nl_no_fallback, related, de}), 4)
+
+    def test_cache_discarded_on_settings_change(self):
+        field = Blog._meta.get_field("title_i18n")
+
+        with override("nl"):
+            # title_nl, title
+            self.assertEqual(
+                len(field.as_expression(bare_lookup="title_i18n").get_source_expressions()), 2
+            )
+
+            with override_settings(MODELTRANS_FALLBACK={"default": ("en",), "nl": ("de", "en")}):
+                expression = field.as_expression(bare_lookup="title_i18n")
+
+        # title_nl, title_de, title
+        self.assertEqual(len(expression.get_source_expressions()), 3)
+
 
 class CustomFallbackLanguageTest(TestCase):
     def test_instance_fallback(self):
@@ -410,3 +540,214 @@ class CreatingInstancesTest(TestCase):
 
         a.refresh_from_db()
         self.assertEqual(a.title_de, defaults["title_de"])
+
+
+class UpdateFieldsTest(TestCase):
+    def test_translated_update_fields(self):
+        b = Blog.objects.create(title="Falcon", i18n={"title_nl": "Valk", "title_de": "Falk"})
+
+        other = Blog.objects.get(pk=b.pk)
+        other.title_nl = "Slechtvalk"
+        other.save(update_fields=["title_nl"])
+
+        b.title = "Peregrine falcon"
+        b.title_de = "Wanderfalke"
+        b.title_fr = "Faucon"
+        b.save(update_fields=["title_en", "title_de"])
+
+        b.refresh_from_db()
+        self.assertEqual(b.title, "Peregrine falcon")
+        self.assertEqual(b.i18n, {"title_nl": "Slechtvalk", "title_de": "Wanderfalke"})
+
+    def test_remove_key(self):
+        b = Blog.objects.create(title="Falcon", i18n={"title_nl": "Valk", "title_de": "Falk"})
+
+        b.title_de = None
+        b.save(update_fields=["title_de"])
+
+        b.refresh_from_db()
+        self.assertEqual(b.i18n, {"title_nl": "Valk"})
+
+    def test_i18n_in_update_fields(self):
+        b = Blog.objects.create(title="Falcon", i18n={"title_nl": "Valk", "title_de": "Falk"})
+        Blog.objects.filter(pk=b.pk).update(title_fr="Faucon")
+
+        b.title_nl = "Slechtvalk"
+        b.save(update_fields=["i18n", "title_nl"])
+
+        b.refresh_from_db()
+        self.assertEqual(b.i18n, {"title_nl": "Slechtvalk", "title_de": "Falk"})
+
+    def test_unknown_field(self):
+        b = Blog.objects.create(title="Falcon")
+
+        with self.assertRaises(ValueError):
+            b.save(update_fields=["title_xx"])
+
+
+class PartialUpdatesTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        class PartialModel(models.Model):
+            title = models.CharField(max_length=100)
+            i18n = TranslationField(fields=("title",), partial_updates=True)
+
+            class Meta:
+                app_label = "tests"
+
+        cls.Model = PartialModel
+        cls.test_model = CreateTestModel(PartialModel, translate=True)
+        cls.test_model.__enter__()
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.test_model.__exit__()
+
+    def test_concurrent_edits(self):
+        m = self.Model.objects.create(title="Falcon", title_nl="Valk", title_de="Falk")
+
+        other = self.Model.objects.get(pk=m.pk)
+        other.title_de = "Wanderfalke"
+        other.save()
+
+        m.title_nl = "Slechtvalk"
+        m.title_fr = "Faucon"
+        m.save()
+
+        m.refresh_from_db()
+        self.assertEqual(
+            m.i18n, {"title_nl": "Slechtvalk", "title_de": "Wanderfalke", "title_fr": "Faucon"}
+        )
+
+    def test_dirty_keys_cleared_after_save(self):
+        m = self.Model.objects.create(title="Falcon", title_nl="Valk")
+        self.assertEqual(m._i18n_dirty_keys, set())
+
+        m.title_nl = "Slechtvalk"
+        self.assertEqual(m._i18n_dirty_keys, {"title_nl"})
+        m.save()
+        self.assertEqual(m._i18n_dirty_keys, set())
+
+        self.Model.objects.filter(pk=m.pk).update(title_nl="Valk")
+        m.save()
+        m.refresh_from_db()
+        self.assertEqual(m.title_nl, "Valk")
+
+    def test_assign_i18n(self):
+        m = self.Model.objects.create(title="Falcon", title_nl="Valk", title_de="Falk")
+
+        m.i18n = {"title_fr": "Faucon"}
+        self.assertNotIn("_i18n_dirty_keys", m.__dict__)
+        m.save()
+
+        m.refresh_from_db()
+        self.assertEqual(m.i18n, {"title_fr": "Faucon"})
+
+
+class SkipUnchangedTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        class SkipUnchangedModel(models.Model):
+            title = models.CharField(max_length=100)
+            i18n = TranslationField(fields=("title",), skip_unchanged=True)
+
+            class Meta:
+                app_label = "tests"
+
+        cls.Model = SkipUnchangedModel
+        cls.test_model = CreateTestModel(SkipUnchangedModel, translate=True)
+        cls.test_model.__enter__()
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.test_model.__exit__()
+
+    def save(self, instance):
+        with CaptureQueriesContext(connection) as ctx:
+            instance.save()
+        (query,) = ctx.captured_queries
+        return query["sql"]
+
+    def test_unchanged(self):
+        self.Model.objects.create(title="Falcon", title_nl="Valk")
+        m = self.Model.objects.get()
+
+        m.title = "Peregrine falcon"
+        self.assertNotIn('"i18n"', self.save(m))
+
+        m.refresh_from_db()
+        self.assertEqual(m.title, "Peregrine falcon")
+        self.assertEqual(m.title_nl, "Valk")
+
+    def test_changed(self):
+        self.Model.objects.create(title="Falcon", title_nl="Valk")
+        m = self.Model.objects.get()
+
+        m.title_nl = "Slechtvalk"
+        self.assertIn('"i18n"', self.save(m))
+        self.assertNotIn('"i18n"', self.save(m))
+
+        m.refresh_from_db()
+        self.assertEqual(m.title_nl, "Slechtvalk")
+
+    def test_update_fields_keeps_pending_keys(self):
+        self.Model.objects.create(title="Falcon", title_nl="Valk")
+        m = self.Model.objects.get()
+
+        m.title_nl = "Slechtvalk"
+        m.title_de = "Falk"
+        m.save(update_fields=["title_nl"])
+        self.assertEqual(m.changed_translation_keys(), {"title_de"})
+
+        # title_de was not written yet, so i18n is not left out of the UPDATE.
+        self.assertIn('"i18n"', self.save(m))
+        m.refresh_from_db()
+        self.assertEqual(m.i18n, {"title_nl": "Slechtvalk", "title_de": "Falk"})
+
+    def test_new_instance(self):
+        m = self.Model(title="Falcon", title_nl="Valk")
+
+        self.assertTrue(m.i18n_has_changed())
+        self.assertEqual(m.changed_translation_keys(), {"title_nl"})
+
+        m.save()
+        self.assertFalse(m.i18n_has_changed())
+        self.assertEqual(m.changed_translation_keys(), set())
+
+    def test_loaded_instance(self):
+        self.Model.objects.create(title="Falcon", i18n={"title_nl": "Valk", "title_de": "Falk"})
+        m = self.Model.objects.get()
+
+        self.assertFalse(m.i18n_has_changed())
+        m.title_nl = "Valk"
+        self.assertFalse(m.i18n_has_changed())
+
+        m.title_nl = "Slechtvalk"
+        m.title_de = None
+        m.i18n["title_fr"] = "Faucon"
+        self.assertTrue(m.i18n_has_changed())
+        self.assertEqual(m.changed_translation_keys(), {"title_nl", "title_de", "title_fr"})
+
+        m.refresh_from_db()
+        self.assertFalse(m.i18n_has_changed())
+
+    def test_deferred_i18n(self):
+        self.Model.objects.create(title="Falcon", i18n={"title_nl": "Valk"})
+        m = self.Model.objects.defer("i18n").get()
+
+        self.assertFalse(m.i18n_has_changed())
+        self.assertEqual(m.i18n, {"title_nl": "Valk"})
+        self.assertFalse(m.i18n_has_changed())
+
+    def test_not_enabled(self):
+        Blog.objects.create(title="Falcon", i18n={"title_nl": "Valk"})
+        b = Blog.objects.get()
+
+        self.assertNotIn("_i18n_snapshot", b.__dict__)
+        self.assertFalse(hasattr(b, "i18n_has_changed"))
@@ -0,0 +1,130 @@
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.db.models import Value
+from django.test import TestCase, override_settings
+from django.utils.translation import override
+
+from modeltrans.indexes import TranslatedIndex
+from modeltrans.operations import CreateFallbackFunction
+from modeltrans.utils import FallbackFunction
+
+from .app.models import Blog, Challenge, ChallengeContent
+
+
+def function_exists():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM pg_proc WHERE proname = 'modeltrans_get'")
+        return cursor.fetchone()[0] > 0
+
+
+class CreateFallbackFunctionTest(TestCase):
+    def test_deconstruct(self):
+        self.assertEqual(CreateFallbackFunction().deconstruct(), ("CreateFallbackFunction", [], {}))
+
+        name, args, kwargs = CreateFallbackFunction(
+            hints={"app": "app"}, elidable=True
+        ).deconstruct()
+        self.assertEqual(kwargs, {"hints": {"app": "app"}, "elidable": True})
+
+        operation = CreateFallbackFunction(*args, **kwargs)
+        self.assertEqual(operation.hints, {"app": "app"})
+        self.assertTrue(operation.elidable)
+
+    def test_forwards_backwards(self):
+        operation = CreateFallbackFunction()
+        state = ProjectState()
+
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_forwards("app", editor, state, state)
+        self.assertTrue(function_exists())
+
+        with connection.schema_editor(atomic=False) as editor:
+            operation.database_backwards("app", editor, state, state)
+        self.assertFalse(function_exists())
+
+
+@override_settings(MODELTRANS_USE_FALLBACK_FUNCTION=True)
+class FallbackFunctionQueryTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with connection.schema_editor(atomic=False) as editor:
+            CreateFallbackFunction().database_forwards("app", editor, ProjectState(), None)
+
+        cls.falcon = Blog.objects.create(title="Falcon", i18n={"title_nl": "Valk", "title_de": ""})
+        cls.vulture = Blog.objects.create(title="Vulture", i18n={"title_de": "Geier"})
+
+    def test_single_function_call(self):
+        with override("nl"):
+            sql = str(Blog.objects.filter(title_i18n="Valk").query)
+
+        self.assertEqual(sql.count("modeltrans_get("), 1)
+        self.assertNotIn("COALESCE", sql)
+
+    def test_inlined(self):
+        with override("nl"):
+            qs = Blog.objects.filter(title_i18n="Valk")
+            with connection.cursor() as cursor:
+                sql, params = qs.query.sql_with_params()
+                cursor.execute("EXPLAIN VERBOSE " + sql, params)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        # PostgreSQL replaces the function call with its body.
+        self.assertNotIn("modeltrans_get", plan)
+        self.assertIn("COALESCE", plan)
+
+    def test_too_many_keys(self):
+        with self.assertRaisesMessage(ValueError, "modeltrans_get accepts at most 10 keys."):
+            FallbackFunction("i18n", [Value("title_nl")] * 11, "title")
+
+    def test_filter(self):
+        with override("nl"):
+            self.assertCountEqual(Blog.objects.filter(title_i18n="Valk"), [self.falcon])
+            self.assertCountEqual(Blog.objects.filter(title_i18n="Vulture"), [self.vulture])
+        with override("de"):
+            # Like Coalesce(), only NULL values are skipped.
+            self.assertCountEqual(Blog.objects.filter(title_i18n=""), [self.falcon])
+            self.assertCountEqual(Blog.objects.filter(title_i18n="Geier"), [self.vulture])
+
+    def test_order_by(self):
+        with override("nl"):
+            qs = Blog.objects.order_by("title_i18n")
+            self.assertEqual([m.title for m in qs], ["Falcon", "Vulture"])
+
+    def test_fallback_language_field(self):
+        instance = Challenge.objects.create(
+            default_language="nl", title="Hurray", i18n={"title_nl": "Hoera"}
+        )
+        Challenge.objects.create(default_language=None, title="Hurray", i18n={"title_nl": "Hoera"})
+
+        with override("de"):
+            # keys depending on the row are not passed to the function.
+            self.assertNotIn(
+                "modeltrans_get", str(Challenge.objects.filter(title_i18n="Hoera").query)
+            )
+            self.assertCountEqual(Challenge.objects.filter(title_i18n="Hoera"), [instance])
+            self.assertEqual(Challenge.objects.filter(title_i18n="Hurray").count(), 1)
+
+    def test_fallback_language_field_follow_relation(self):
+        challenge = Challenge.objects.create(default_language="nl", title="Hurray")
+        content = ChallengeContent.objects.create(
+            challenge=challenge, content="Congratulations", i18n={"content_nl": "Gefeliciteerd"}
+        )
+
+        with override("de"):
+            self.assertCountEqual(
+                ChallengeContent.objects.filter(content_i18n="Gefeliciteerd"), [content]
+            )
+
+    def test_index(self):
+        index = TranslatedIndex("title_i18n", language="nl", name="blog_title_nl_function")
+
+        with connection.cursor() as cursor:
+            # Blog has foreign keys, fire pending trigger events before altering the table.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        with connection.schema_editor() as editor:
+            editor.add_index(Blog, index)
+
+        constraints = connection.introspection.get_constraints(
+            connection.cursor(), Blog._meta.db_table
+        )
+        self.assertIn("blog_title_nl_function", constraints)
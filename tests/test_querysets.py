@@ -1,16 +1,33 @@
 import pickle
-from unittest import skipIf
+from unittest import mock, skipIf
 
 import django
 from django.db import models
-from django.db.models import F, Q
+from django.db.models import Count, F, Q
+from django.db.models.functions import Upper
 from django.test import TestCase, override_settings
 from django.utils.translation import override
 
 from modeltrans.fields import TranslationField
+from modeltrans.manager import (
+    MultilingualQuerySet,
+    clear_lookup_cache,
+    get_translated_lookup_roots,
+    resolve_lookup,
+)
 from modeltrans.translator import translate_model
-
-from .app.models import Attribute, Blog, BlogAttr, Category, Challenge, ChallengeContent, Site
+from modeltrans.utils import ActiveLanguageExpression
+
+from .app.models import (
+    Attribute,
+    Blog,
+    BlogAttr,
+    Category,
+    Challenge,
+    ChallengeContent,
+    Site,
+    TaggedBlog,
+)
 from .utils import CreateTestModel, load_wiki
 
 
@@ -71,6 +88,84 @@ class GetFieldTest(TestCase):
         self.assert_lookup("title__lower__endswith", "title", "lower__endswith")
         self.assert_lookup("category__name__lower__endswith", "name", "lower__endswith")
 
+    def test_cached(self):
+        clear_lookup_cache()
+        Blog.objects.all()._get_field("category__name__contains")
+
+        with mock.patch.object(Blog._meta, "get_field", side_effect=AssertionError):
+            self.assert_lookup("category__name__contains", "name", "contains")
+
+    def test_cache_stored_on_model(self):
+        clear_lookup_cache()
+        resolve_lookup(Blog, "title_nl")
+
+        self.assertIn("title_nl", Blog._meta._modeltrans_lookup_cache.lookups)
+
+        with mock.patch("modeltrans.manager.LOOKUP_CACHE_SIZE", 2):
+            for lookup in ("title", "title_de", "title_fr", "body_nl"):
+                resolve_lookup(Blog, lookup)
+            self.assertLessEqual(len(Blog._meta._modeltrans_lookup_cache.lookups), 2)
+
+    def test_cache_cleared_by_translate_model(self):
+        class LaterTranslatedModel(models.Model):
+            title = models.CharField(max_length=100)
+            i18n = TranslationField(fields=("title",))
+
+            class Meta:
+                app_label = "tests"
+
+        self.assertEqual(resolve_lookup(LaterTranslatedModel, "title_nl"), (None, "title_nl"))
+
+        translate_model(LaterTranslatedModel)
+
+        field, lookup_type = resolve_lookup(LaterTranslatedModel, "title_nl")
+        self.assertEqual(field.name, "title_nl")
+        self.assertIsNone(lookup_type)
+
+
+class BypassRewriteTest(TestCase):
+    def test_translated_lookup_roots(self):
+        roots = get_translated_lookup_roots(Blog)
+
+        self.assertIn("title_nl", roots)
+        self.assertIn("title_i18n", roots)
+        self.assertIn("category", roots)
+        self.assertNotIn("title", roots)
+        self.assertNotIn("i18n", roots)
+
+        self.assertEqual(get_translated_lookup_roots(Site), {"blog"})
+
+    def test_filter_without_translated_fields(self):
+        with mock.patch.object(MultilingualQuerySet, "_rewrite_filter_clause") as rewrite:
+            qs = Blog.objects.filter(pk__in=[1, 2], title="Falcon").exclude(
+                Q(category__isnull=True) | Q(body=F("title"))
+            )
+            str(qs.query)
+
+        rewrite.assert_not_called()
+
+    def test_filter_with_translated_value(self):
+        with mock.patch.object(
+            MultilingualQuerySet,
+            "_rewrite_filter_clause",
+            side_effect=lambda lookup, value, negated=False: (lookup, value),
+        ) as rewrite:
+            Blog.objects.filter(title=F("title_nl"))
+
+        rewrite.assert_called_once()
+
+    def test_order_by_without_translated_fields(self):
+        with mock.patch.object(MultilingualQuerySet, "_rewrite_ordering") as rewrite:
+            Blog.objects.order_by("-title", "category__pk", F("body").asc())
+
+        rewrite.assert_not_called()
+
+    def test_annotate_without_translated_fields(self):
+        with mock.patch.object(MultilingualQuerySet, "_rewrite_expression") as rewrite:
+            Blog.objects.annotate(Count("category"), upper=Upper("title"))
+
+        rewrite.assert_not_called()
+
 
 class PickleTest(TestCase):
     @classmethod
@@ -136,6 +231,98 @@ class FilterTest(TestCase):
         qs = Blog.objects.filter(title="Falcon")
         self.assertEqual(qs[0].title, "Falcon")
 
+    def test_filter_does_not_select_translated_value(self):
+        with override("nl"):
+            qs = Blog.objects.filter(title_nl="Valk", title_i18n__contains="a")
+            sql = str(qs.query)
+
+        self.assertNotIn("title_nl", sql[: sql.index(" FROM ")])
+        self.assertIn("title_nl", sql[sql.index(" WHERE ") :])
+        self.assertEqual(qs[0].title, "Falcon")
+        self.assertFalse(hasattr(qs[0], "title_nl_annotation"))
+
+        qs = qs.values_list("title_nl", flat=True)
+        self.assertEqual(list(qs), ["Valk"])
+
+    def test_filter_exact_uses_containment(self):
+        qs = Blog.objects.filter(title_nl="Valk")
+        self.assertIn('"app_blog"."i18n" @> ', str(qs.query))
+        self.assertEqual(key(qs, "title"), "Falcon")
+
+        # not for the default language or the active language.
+        self.assertNotIn("@>", str(Blog.objects.filter(title_en="Falcon").query))
+        self.assertNotIn("@>", str(Blog.objects.filter(title_i18n="Falcon").query))
+        # not for other lookup types.
+        self.assertNotIn("@>", str(Blog.objects.filter(title_nl__iexact="valk").query))
+
+        qs = Blog.objects.exclude(title_nl="Valk").order_by("title")
+        self.assertEqual(key(qs, "title"), "Dolphin Duck Frog Toad")
+
+        qs = Blog.objects.filter(Q(title_nl="Valk") | Q(title_nl="Pad")).order_by("title")
+        self.assertEqual(key(qs, "title"), "Falcon Toad")
+
+        qs = Blog.objects.filter(category__name_nl="Vogels").order_by("title")
+        self.assertEqual(key(qs, "title"), "Duck Falcon")
+
+    def test_filter_in_uses_containment(self):
+        qs = Blog.objects.filter(title_nl__in=["Valk", "Pad", "Foo"]).order_by("title")
+        self.assertEqual(str(qs.query).count("@>"), 3)
+        self.assertEqual(key(qs, "title"), "Falcon Toad")
+
+        qs = Blog.objects.exclude(title_nl__in=("Valk", "Pad")).order_by("title")
+        self.assertEqual(key(qs, "title"), "Dolphin Duck Frog")
+
+    def test_exclude_missing_translations(self):
+        Blog.objects.create(title="Owl", i18n={})
+        Blog.objects.create(title="Heron", i18n={"title_nl": None})
+        Blog.objects.create(title="Crow")
+        Blog.objects.filter(title="Crow").update(i18n=None)
+
+        # negated lookups are not rewritten, rows without a translation are excluded.
+        for qs in (
+            Blog.objects.exclude(title_nl="Valk"),
+            Blog.objects.filter(~Q(title_nl="Valk")),
+            Blog.objects.exclude(Q(title_nl="Valk") | Q(title_nl="Pad")),
+            Blog.objects.exclude(title_nl__in=["Valk", "Pad"]),
+            Blog.objects.filter(~Q(title_nl__in=["Valk", "Pad"])),
+        ):
+            self.assertNotIn("@>", str(qs.query))
+            self.assertNotIn("Owl", key(qs, "title"))
+            self.assertNotIn("Heron", key(qs, "title"))
+            self.assertNotIn("Crow", key(qs, "title"))
+
+        qs = Blog.objects.exclude(title_nl="Valk").order_by("title")
+        self.assertEqual(key(qs, "title"), "Dolphin Duck Frog Toad")
+
+        # a negation inside a negation can be rewritten.
+        qs = Blog.objects.exclude(~Q(title_nl="Valk"))
+        self.assertIn("@>", str(qs.query))
+        self.assertEqual(key(qs, "title"), "Falcon")
+
+    def test_filter_isnull_uses_has_key(self):
+        Blog.objects.create(title="Gecko")
+        Blog.objects.create(title="Lizard", i18n={"title_nl": None})
+
+        qs = Blog.objects.filter(title_nl__isnull=False)
+        self.assertIn('"app_blog"."i18n" ? ', str(qs.query))
+        self.assertEqual(qs.count(), 5)
+
+        qs = Blog.objects.filter(title_nl__isnull=True).order_by("title")
+        self.assertEqual(key(qs, "title"), "Gecko Lizard")
+
+    def test_filter_isnull_reverse_relation(self):
+        terrarium = Site.objects.create(name="Terrarium")
+        Blog.objects.create(title="Gecko", site=terrarium)
+        Blog.objects.create(title="Lizard", site=terrarium, i18n={"title_nl": None})
+        aviary = Site.objects.create(name="Aviary")
+        Blog.objects.create(title="Owl", site=aviary, i18n={"title_nl": "Uil"})
+        Blog.objects.create(title="Heron", site=aviary, i18n={"title_nl": "Reiger"})
+
+        # a single join, so the site is returned once for each matching blog.
+        qs = Site.objects.filter(blog__title_nl__isnull=False)
+        self.assertEqual(str(qs.query).count("JOIN"), 1)
+        self.assertEqual([site.name for site in qs], ["Aviary", "Aviary"])
+
     def test_filter_startswith(self):
         qs = Blog.objects.filter(title_nl__startswith="Va")
         self.assertEqual(qs[0].title, "Falcon")
@@ -291,6 +478,109 @@ class FilterTest(TestCase):
         self.assertEqual({m.name for m in qs}, {"Modeltrans blog"})
 
 
+class ActiveLanguageTest(TestCase):
+    """
+    Querysets using `<field>_i18n` use the language active when they are evaluated.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.site = Site.objects.create(name="Birds")
+        cls.falcon = Blog.objects.create(title="Falcon", title_nl="Valk", site=cls.site)
+        cls.vulture = Blog.objects.create(title="Vulture", title_nl="Gier")
+
+    def test_filter(self):
+        qs = Blog.objects.filter(title_i18n="Valk")
+
+        self.assertCountEqual(qs.all(), [])
+        with override("nl"):
+            self.assertCountEqual(qs.all(), [self.falcon])
+        with override("de"):
+            self.assertCountEqual(qs.all(), [])
+
+    @override_settings(MODELTRANS_AVAILABLE_LANGUAGES=("nl", "de", "fr", "es", "it", "pt", "sv"))
+    def test_resolves_columns_once(self):
+        qs = Blog.objects.filter(title_i18n="Valk")
+
+        # the columns used by any language, instead of an expression for each language.
+        expression = qs.query.where.children[0].lhs
+        self.assertIsInstance(expression, ActiveLanguageExpression)
+        self.assertCountEqual(
+            [column.target.name for column in expression.get_source_expressions()],
+            ["title", "i18n"],
+        )
+
+        with override("sv"):
+            self.assertCountEqual(qs.all(), [])
+        with override("nl"):
+            self.assertCountEqual(qs.all(), [self.falcon])
+
+    def test_filter_related(self):
+        with override("de"):
+            qs = Site.objects.filter(blog__title_i18n__startswith="Va")
+
+        with override("nl"):
+            self.assertCountEqual(qs.all(), [self.site])
+        self.assertCountEqual(qs.all(), [])
+
+    def test_order_by(self):
+        qs = Blog.objects.order_by("title_i18n")
+
+        self.assertEqual(key(qs.all(), "title"), "Falcon Vulture")
+        with override("nl"):
+            self.assertEqual(key(qs.all(), "title"), "Vulture Falcon")
+
+    def test_values(self):
+        qs = Blog.objects.order_by("title").values_list("title_i18n", flat=True)
+
+        self.assertEqual(list(qs.all()), ["Falcon", "Vulture"])
+        with override("nl"):
+            self.assertEqual(list(qs.all()), ["Valk", "Gier"])
+
+    def test_annotate(self):
+        qs = Blog.objects.annotate(upper=Upper("title_i18n")).order_by("title")
+
+        with override("nl"):
+            self.assertEqual(key(qs.all(), "upper"), "VALK GIER")
+
+    def test_filter_fallback_language_field(self):
+        challenge = Challenge.objects.create(title="Hurray", default_language="de")
+        content = ChallengeContent.objects.create(
+            challenge=challenge, content="Congratulations", i18n={"content_de": "Glückwunsch"}
+        )
+
+        # only the expression for "nl" needs a join to challenge for the fallback language.
+        qs = ChallengeContent.objects.filter(content_i18n="Glückwunsch")
+
+        with override("nl"):
+            self.assertCountEqual(qs.all(), [content])
+        self.assertCountEqual(qs.all(), [])
+
+        with override("nl"):
+            qs = ChallengeContent.objects.order_by("content_i18n").values_list(
+                "content_i18n", flat=True
+            )
+        self.assertEqual(list(qs.all()), ["Congratulations"])
+        with override("fr"):
+            self.assertEqual(list(qs.all()), ["Glückwunsch"])
+
+    def test_subquery(self):
+        qs = Site.objects.filter(
+            pk__in=Blog.objects.filter(title_i18n__startswith="Va").values("site")
+        )
+
+        self.assertCountEqual(qs.all(), [])
+        with override("nl"):
+            self.assertCountEqual(qs.all(), [self.site])
+
+    def test_deconstruct_uses_default_language(self):
+        qs = Blog.objects.order_by("title_i18n")
+
+        with override("nl"):
+            (expression,) = qs.query.order_by
+            self.assertEqual(expression.deconstruct(), F("title").deconstruct())
+
+
 class CustomFallbackTest(TestCase):
     def test_custom_fallback(self):
         instance = Challenge.objects.create(
@@ -507,6 +797,15 @@ class OrderByTest(TestCase):
             qs = filtered.order_by(Lower("title_i18n"))
             self.assertEqual(key(qs, "title"), "a A")
 
+    def test_order_by_does_not_select_translated_value(self):
+        with override("nl"):
+            sql = str(Blog.objects.order_by("title_i18n", "-body_nl").query)
+
+        self.assertNotIn("title_nl", sql[: sql.index(" FROM ")])
+        self.assertNotIn("body_nl", sql[: sql.index(" FROM ")])
+        self.assertIn("title_nl", sql[sql.index(" ORDER BY ") :])
+        self.assertIn("body_nl", sql[sql.index(" ORDER BY ") :])
+
     def test_order_by_two_virtual_fields(self):
         ca = Category.objects.create(name="foo a", title="test a", title_nl="testje a")
         cb = Category.objects.create(name="foo b", title="test b", title_nl="testje b")
@@ -634,6 +933,88 @@ class FallbackOrderByTest(TestCase):
                 )
 
 
+@skipIf(django.VERSION < (5, 0), "GeneratedField requires Django 5.0 or later")
+class GeneratedLanguagesTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        class GeneratedModel(models.Model):
+            title = models.CharField(max_length=100)
+            i18n = TranslationField(fields=("title",), generated_languages=("nl",))
+
+            class Meta:
+                app_label = "tests"
+
+        cls.Model = GeneratedModel
+        cls.test_model = CreateTestModel(GeneratedModel, translate=True)
+        cls.test_model.__enter__()
+
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.test_model.__exit__()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.Model.objects.create(title="Falcon", title_nl="Valk", title_de="Falke")
+        cls.Model.objects.create(title="Frog", title_nl="Kikker")
+        cls.Model.objects.create(title="Gecko")
+
+    def test_generated_column(self):
+        qs = self.Model.objects.order_by("title").values_list("title_nl_gen", flat=True)
+        self.assertEqual(list(qs), ["Valk", "Kikker", None])
+
+        self.assertFalse(self.Model._meta.get_field("title_nl_gen").editable)
+
+    def test_filter(self):
+        qs = self.Model.objects.filter(title_nl="Valk")
+        self.assertIn('"title_nl_gen" = ', str(qs.query))
+        self.assertNotIn("->>", str(qs.query))
+        self.assertEqual(key(qs, "title"), "Falcon")
+
+        qs = self.Model.objects.filter(title_nl__startswith="K")
+        self.assertEqual(key(qs, "title"), "Frog")
+
+        qs = self.Model.objects.filter(title_nl__isnull=True)
+        self.assertEqual(key(qs, "title"), "Gecko")
+
+    def test_filter_other_language(self):
+        qs = self.Model.objects.filter(title_de="Falke")
+        self.assertIn("@>", str(qs.query))
+        self.assertEqual(key(qs, "title"), "Falcon")
+
+    def test_order_by(self):
+        qs = self.Model.objects.order_by("title_nl")
+        self.assertIn('"title_nl_gen"', str(qs.query))
+        self.assertEqual(key(qs, "title"), "Gecko Frog Falcon")
+
+        with override("nl"):
+            qs = self.Model.objects.order_by("-title_i18n")
+            self.assertEqual(key(qs, "title_i18n"), "Valk Kikker Gecko")
+
+    def test_filter_active_language(self):
+        # the generated column is resolved when building the queryset in another language.
+        qs = self.Model.objects.filter(title_i18n="Valk")
+        with override("nl"):
+            self.assertIn('COALESCE("tests_generatedmodel"."title_nl_gen"', str(qs.query))
+            self.assertEqual(key(qs, "title"), "Falcon")
+        with override("de"):
+            self.assertEqual(list(qs.all()), [])
+
+    def test_values(self):
+        qs = self.Model.objects.order_by("title").values_list("title_nl", flat=True)
+        self.assertIn('"title_nl_gen"', str(qs.query))
+        self.assertEqual(list(qs), ["Valk", "Kikker", None])
+
+    def test_update_i18n(self):
+        instance = self.Model.objects.get(title="Gecko")
+        instance.title_nl = "Gekko"
+        instance.save()
+
+        self.assertEqual(key(self.Model.objects.filter(title_nl="Gekko"), "title"), "Gecko")
+
+
 class FilteredOrderByTest(TestCase):
     def test_filtered_order_by(self):
         Blog.objects.bulk_create(
@@ -771,3 +1152,345 @@ class ValuesTest(TestCase):
     def test_values_spanning_relation(self):
         qs = Blog.objects.all().order_by("title_nl").values_list("title_nl", "category__name_nl")
         self.assertEqual(list(qs), [(None, None), ("Kikker", "Amfibiën"), ("Valk", "Vogels")])
+
+
+class WithTranslationsTest(TestCase):
+    def setUp(self):
+        Blog.objects.bulk_create(
+            [
+                Blog(title="Falcon", title_nl="Valk", title_de="Falk"),
+                Blog(title="Frog", title_nl="", title_de="Frosch"),
+                Blog(title="Gecko"),
+            ]
+        )
+
+    def assert_same_values(self, qs, field_name):
+        expected = list(getattr(blog, field_name) for blog in Blog.objects.order_by("pk"))
+        self.assertEqual(key(qs.order_by("pk"), field_name, sep=None), expected)
+
+    def test_with_translations(self):
+        for language in ("en", "nl", "de", "fr"):
+            with override(language):
+                self.assert_same_values(Blog.objects.with_translations(), "title_i18n")
+                self.assert_same_values(Blog.objects.with_translations("title"), "title_i18n")
+                self.assert_same_values(Blog.objects.with_translations("body_i18n"), "body_i18n")
+
+    def test_with_translations_does_not_walk_fallback_chain(self):
+        field = Blog._meta.get_field("title_i18n")
+
+        with override("nl"):
+            blogs = list(Blog.objects.with_translations("title").order_by("pk"))
+
+            with mock.patch.object(field, "_get_fallback_value") as get_fallback_value:
+                self.assertEqual(key(blogs, "title_i18n"), "Valk Frog Gecko")
+            get_fallback_value.assert_not_called()
+
+    def test_with_translations_other_language(self):
+        with override("nl"):
+            qs = Blog.objects.with_translations("title").order_by("pk")
+
+        with override("de"):
+            self.assertEqual(key(qs, "title_i18n"), "Falk Frosch Gecko")
+
+    def test_with_translations_set_value(self):
+        with override("nl"):
+            blog = Blog.objects.with_translations("title").get(title="Frog")
+            self.assertEqual(blog.title_i18n, "Frog")
+
+            blog.title_nl = "Kikker"
+            self.assertEqual(blog.title_i18n, "Kikker")
+
+    def test_with_translations_assign_i18n(self):
+        with override("nl"):
+            blog = Blog.objects.with_translations("title").get(title="Falcon")
+            self.assertEqual(blog.title_i18n, "Valk")
+
+            blog.i18n = {"title_nl": "Slechtvalk"}
+            self.assertEqual(blog.title_i18n, "Slechtvalk")
+
+            blog.title = "Peregrine falcon"
+            blog.i18n = {}
+            self.assertEqual(blog.title_i18n, "Peregrine falcon")
+
+    def test_with_translations_defer_i18n(self):
+        with override("de"):
+            qs = Blog.objects.with_translations("title").defer("i18n").order_by("pk")
+            self.assertEqual(key(qs, "title_i18n"), "Falk Frosch Gecko")
+
+    def test_with_translations_custom_fallback(self):
+        Challenge.objects.create(title="Hurray", default_language="nl", title_nl="Hoera")
+        Challenge.objects.create(title="Sunny", default_language="en", title_nl="Zonnig")
+
+        with override("de"):
+            qs = Challenge.objects.with_translations("title").order_by("pk")
+            self.assertEqual(key(qs, "title_i18n"), "Hoera Sunny")
+
+    def test_with_translations_change_fallback_language(self):
+        Challenge.objects.create(
+            title="Hurray", default_language="nl", title_nl="Hoera", title_fr="Hourra"
+        )
+
+        with override("de"):
+            challenge = Challenge.objects.with_translations("title").get()
+            self.assertEqual(challenge.title_i18n, "Hoera")
+
+            challenge.default_language = "fr"
+            self.assertEqual(challenge.title_i18n, "Hourra")
+
+    def test_with_translations_values(self):
+        with override("nl"):
+            qs = Blog.objects.with_translations("title").order_by("pk")
+            self.assertEqual(list(qs.values_list("title", flat=True)), ["Falcon", "Frog", "Gecko"])
+
+            self.assertNotIn("_title_i18n_resolved", qs.values()[0])
+            self.assertEqual(len(qs.values_list()[0]), len(Blog.objects.values_list()[0]))
+            self.assertEqual(qs.annotate(upper=Upper("title")).values()[0]["upper"], "FALCON")
+
+    def test_with_translations_not_translated(self):
+        with self.assertRaisesMessage(ValueError, '"category" is not a translated field.'):
+            Blog.objects.with_translations("category")
+
+    def test_with_translations_pickle(self):
+        with override("nl"):
+            qs = pickle.loads(pickle.dumps(Blog.objects.with_translations("title").order_by("pk")))
+            self.assertEqual(key(qs, "title_i18n"), "Valk Frog Gecko")
+
+
+class OnlyLanguagesTest(TestCase):
+    def setUp(self):
+        Blog.objects.create(
+            title="Falcon", title_nl="Valk", title_de="Falk", title_fr="Faucon", body_fr="Oiseau"
+        )
+
+    def test_only_languages(self):
+        blog = Blog.objects.only_languages("nl").get()
+
+        self.assertEqual(blog.i18n, {"title_nl": "Valk"})
+        self.assertEqual(blog.title_nl, "Valk")
+        self.assertEqual(blog.title_de, None)
+
+    def test_only_languages_active_language(self):
+        with override("de"):
+            blog = Blog.objects.only_languages().get()
+            self.assertEqual(blog.i18n, {"title_de": "Falk"})
+            self.assertEqual(blog.title_i18n, "Falk")
+
+    def test_only_languages_sql(self):
+        sql = str(Blog.objects.only_languages("nl", "de").query)
+
+        self.assertIn('("app_blog"."i18n" - ', sql)
+        self.assertIn("title_fr", sql)
+        self.assertNotIn("title_nl", sql)
+
+    def test_only_languages_save_keeps_other_languages(self):
+        blog = Blog.objects.only_languages("nl").get()
+        blog.title_nl = "Slechtvalk"
+        blog.title_de = "Wanderfalke"
+        blog.save()
+
+        blog = Blog.objects.get()
+        self.assertEqual(
+            blog.i18n,
+            {
+                "title_nl": "Slechtvalk",
+                "title_de": "Wanderfalke",
+                "title_fr": "Faucon",
+                "body_fr": "Oiseau",
+            },
+        )
+
+    def test_only_languages_save_removed_value(self):
+        blog = Blog.objects.only_languages("nl").get()
+        blog.title_nl = None
+        blog.save()
+
+        blog = Blog.objects.get()
+        self.assertEqual(blog.i18n, {"title_de": "Falk", "title_fr": "Faucon", "body_fr": "Oiseau"})
+
+    def test_only_languages_refresh_from_db(self):
+        blog = Blog.objects.only_languages("nl").get()
+        blog.refresh_from_db()
+
+        self.assertEqual(blog.title_fr, "Faucon")
+
+        blog.i18n = {"title_nl": "Valk"}
+        blog.save()
+        self.assertEqual(Blog.objects.get().i18n, {"title_nl": "Valk"})
+
+    def test_only_languages_values(self):
+        qs = Blog.objects.only_languages("nl")
+
+        self.assertNotIn("_i18n_projection", qs.values()[0])
+        self.assertEqual(qs.values()[0], Blog.objects.values()[0])
+        self.assertEqual(list(qs.values_list("title_nl", flat=True)), ["Valk"])
+
+    def test_only_languages_assign_i18n(self):
+        with override("de"):
+            blog = Blog.objects.only_languages().with_translations("title").get()
+            self.assertEqual(blog.title_i18n, "Falk")
+
+            blog.i18n = {"title_de": "Wanderfalke"}
+            self.assertEqual(blog.title_i18n, "Wanderfalke")
+
+        blog = Blog.objects.only_languages("nl").get()
+        self.assertNotIn("_i18n_cache", blog.__dict__)
+
+    def test_only_languages_custom_fallback(self):
+        with self.assertRaisesMessage(ValueError, "requires explicit languages"):
+            Challenge.objects.only_languages()
+
+        Challenge.objects.create(title="Hurray", default_language="nl", title_nl="Hoera")
+        with override("de"):
+            challenge = Challenge.objects.only_languages("de", "nl").get()
+            self.assertEqual(challenge.title_i18n, "Hoera")
+
+
+class UpdateTest(TestCase):
+    def setUp(self):
+        self.falcon = Blog.objects.create(
+            title="Falcon", body="Bird", i18n={"title_nl": "Valk", "title_de": "Falke"}
+        )
+        self.vulture = Blog.objects.create(title="Vulture")
+
+    def test_update_translated_field(self):
+        self.assertEqual(Blog.objects.filter(title="Falcon").update(title_nl="Slechtvalk"), 1)
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Slechtvalk", "title_de": "Falke"})
+
+    def test_update_null_i18n(self):
+        Blog.objects.filter(pk=self.vulture.pk).update(i18n=None)
+        Blog.objects.filter(pk=self.vulture.pk).update(title_fr="Vautour")
+
+        self.vulture.refresh_from_db()
+        self.assertEqual(self.vulture.i18n, {"title_fr": "Vautour"})
+
+    def test_update_none_removes_key(self):
+        Blog.objects.filter(pk=self.falcon.pk).update(title_de=None, body_nl="Vogel")
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Valk", "body_nl": "Vogel"})
+
+    def test_update_default_language(self):
+        Blog.objects.filter(pk=self.falcon.pk).update(title_en="Peregrine", title_nl="Slechtvalk")
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.title, "Peregrine")
+        self.assertEqual(self.falcon.title_nl, "Slechtvalk")
+
+    def test_update_active_language(self):
+        with override("de"):
+            Blog.objects.filter(pk=self.falcon.pk).update(title_i18n="Wanderfalke")
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.title_de, "Wanderfalke")
+
+    def test_update_expressions(self):
+        Blog.objects.update(body_de=F("body"), title_fr=Upper("title_nl"))
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.body_de, "Bird")
+        self.assertEqual(self.falcon.title_fr, "VALK")
+
+        # Expressions evaluating to NULL are stored as null, only None removes the key.
+        self.vulture.refresh_from_db()
+        self.assertEqual(self.vulture.i18n, {"body_de": "", "title_fr": None})
+
+    def test_update_json_field(self):
+        blog = TaggedBlog.objects.create(title="Falcon", tags=["bird"])
+        TaggedBlog.objects.update(tags_nl=["vogel", "roofvogel"])
+
+        blog.refresh_from_db()
+        self.assertEqual(blog.tags_nl, ["vogel", "roofvogel"])
+
+    def test_update_conflicts(self):
+        with self.assertRaisesMessage(ValueError, 'Attempted override of "title" with "title_en"'):
+            Blog.objects.update(title="Falcon", title_en="Falcon")
+
+        with self.assertRaisesMessage(ValueError, "Updating i18n together with translated fields"):
+            Blog.objects.update(i18n={}, title_nl="Valk")
+
+
+class BulkUpdateTest(TestCase):
+    def setUp(self):
+        self.falcon = Blog.objects.create(
+            title="Falcon", i18n={"title_nl": "Valk", "title_de": "Falke"}
+        )
+        self.vulture = Blog.objects.create(title="Vulture", i18n={"title_nl": "Gier"})
+
+    def test_bulk_update_translated_field(self):
+        self.falcon.title_nl = "Slechtvalk"
+        self.vulture.title_nl = None
+
+        # Concurrent change to another language, should not be overwritten.
+        Blog.objects.filter(pk=self.falcon.pk).update(title_de="Wanderfalke")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(Blog.objects.bulk_update([self.falcon, self.vulture], ["title_nl"]), 2)
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Slechtvalk", "title_de": "Wanderfalke"})
+        self.vulture.refresh_from_db()
+        self.assertEqual(self.vulture.i18n, {})
+
+    def test_bulk_update_only_languages(self):
+        falcon, vulture = Blog.objects.only_languages("de").order_by("pk")
+        falcon.title_de = "Wanderfalke"
+        vulture.title_nl = None
+
+        Blog.objects.bulk_update([falcon, vulture], ["title_nl", "title_de"])
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Valk", "title_de": "Wanderfalke"})
+        self.vulture.refresh_from_db()
+        self.assertEqual(self.vulture.i18n, {})
+
+    def test_bulk_update_deferred_i18n(self):
+        falcon = Blog.objects.defer("i18n").get(pk=self.falcon.pk)
+        falcon.title = "Peregrine"
+
+        Blog.objects.bulk_update([falcon], ["title", "title_nl"])
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.title, "Peregrine")
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Valk", "title_de": "Falke"})
+
+        # i18n is still deferred, so saving does not overwrite it.
+        self.assertIn("i18n", falcon.get_deferred_fields())
+        falcon.save()
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.i18n, {"title_nl": "Valk", "title_de": "Falke"})
+
+    def test_bulk_update_restores_i18n(self):
+        self.falcon.title_fr = "Faucon"
+        Blog.objects.bulk_update([self.falcon], ["title_fr"])
+
+        self.assertEqual(
+            self.falcon.i18n, {"title_nl": "Valk", "title_de": "Falke", "title_fr": "Faucon"}
+        )
+
+    def test_bulk_update_mixed_fields(self):
+        self.falcon.title_en = "Peregrine"
+        self.falcon.body = "Bird"
+        self.falcon.body_nl = "Vogel"
+
+        Blog.objects.bulk_update([self.falcon], ["title_en", "body", "body_nl"], batch_size=1)
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.title, "Peregrine")
+        self.assertEqual(self.falcon.body, "Bird")
+        self.assertEqual(
+            self.falcon.i18n, {"title_nl": "Valk", "title_de": "Falke", "body_nl": "Vogel"}
+        )
+
+    def test_bulk_update_active_language(self):
+        with override("de"):
+            self.falcon.title_i18n = "Wanderfalke"
+            Blog.objects.bulk_update([self.falcon], ["title_i18n"])
+
+        self.falcon.refresh_from_db()
+        self.assertEqual(self.falcon.title_de, "Wanderfalke")
+
+    def test_bulk_update_i18n_and_translated_field(self):
+        with self.assertRaisesMessage(ValueError, "Updating i18n together with translated fields"):
+            Blog.objects.bulk_update([self.falcon], ["i18n", "title_nl"])
@@ -1,3 +1,5 @@
+from unittest import skipIf
+
 import django
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db import models
@@ -45,6 +47,7 @@ class Translating_utils(TestCase):
             app_models.Choice,
             app_models.Challenge,
             app_models.ChallengeContent,
+            app_models.Species,
             app_models.Post,
             app_models.Comment,
         }
@@ -112,6 +115,30 @@ class TranslateModelTest(TestCase):
         with self.assertRaisesMessage(ImproperlyConfigured, expected_message):
             translate_model(A)
 
+    @skipIf(django.VERSION < (5, 0), "GeneratedField requires Django 5.0 or later")
+    def test_translate_bad_generated_language(self):
+        class GeneratedDefaultLanguage(models.Model):
+            title = models.CharField(max_length=100)
+
+            i18n = TranslationField(fields=("title",), generated_languages=("en",))
+
+            class Meta:
+                app_label = "django-modeltrans_tests"
+
+        expected_message = (
+            'Language "en" is in generated_languages on Model "GeneratedDefaultLanguage"'
+        )
+        with self.assertRaisesMessage(ImproperlyConfigured, expected_message):
+            translate_model(GeneratedDefaultLanguage)
+
+    @skipIf(django.VERSION >= (5, 0), "GeneratedField is available in Django 5.0 and later")
+    def test_generated_languages_unsupported(self):
+        expected_message = (
+            'Argument "generated_languages" to TranslationField requires Django 5.0 or later.'
+        )
+        with self.assertRaisesMessage(ImproperlyConfigured, expected_message):
+            TranslationField(fields=("title",), generated_languages=("nl",))
+
     def test_translation_unsupported_field(self):
         class IntegerModel(models.Model):
             integer = models.IntegerField()
@@ -265,6 +292,22 @@ class TranslateModelTest(TestCase):
             list(e.exception), [("title_nl", ["must be equal to or greater than 20."])]
         )
 
+    def test_localized_fieldnames(self):
+        title_nl = app_models.Blog._meta.get_field("title_nl")
+        title_i18n = app_models.Blog._meta.get_field("title_i18n")
+
+        # the table is shared between the virtual fields of an original field
+        self.assertIs(title_nl.localized_fieldnames, title_i18n.localized_fieldnames)
+        self.assertEqual(
+            title_i18n.localized_fieldnames,
+            {"en": "title_en", "nl": "title_nl", "de": "title_de", "fr": "title_fr"},
+        )
+        self.assertEqual(title_i18n.get_localized_fieldname("nl"), "title_nl")
+
+        # languages unknown when adding the virtual fields are still supported.
+        self.assertEqual(title_i18n.get_localized_fieldname("pt-br"), "title_pt_br")
+        self.assertEqual(title_i18n.get_localized_fieldname("id"), "title_ind")
+
     def test_model_meta_ordering_pk(self):
         """
         When Model.Meta.ordering contains 'pk'